@@ -0,0 +1,53 @@
+"""Add covering indexes for the cross-election vote tally
+
+Revision ID: a7c91d20e4f3
+Revises: d2f6a81c43b7
+Create Date: 2026-08-31 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c91d20e4f3"  # pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = "d2f6a81c43b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # get_top_noms sums weight grouped by book_id across all elections;
+    # carrying weight in the index turns that into an index-only scan.
+    op.create_index(
+        "votes_book_id_weight_idx",
+        "votes",
+        ["book_id", "weight"],
+    )
+    # Widen the partial ballot index to carry reactions so the nomination
+    # side of the join is index-only too; the old index is a strict prefix.
+    op.create_index(
+        "nominations_reactions_positive_covering_idx",
+        "nominations",
+        ["book_id", "reactions"],
+        postgresql_where=sa.text("reactions > 0"),
+    )
+    op.drop_index("nominations_reactions_positive_idx", table_name="nominations")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "nominations_reactions_positive_idx",
+        "nominations",
+        ["book_id"],
+        postgresql_where=sa.text("reactions > 0"),
+    )
+    op.drop_index(
+        "nominations_reactions_positive_covering_idx", table_name="nominations"
+    )
+    op.drop_index("votes_book_id_weight_idx", table_name="votes")
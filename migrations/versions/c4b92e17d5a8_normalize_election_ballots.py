@@ -0,0 +1,58 @@
+"""Normalize election ballots into an indexable entry table
+
+Revision ID: c4b92e17d5a8
+Revises: a7c91d20e4f3
+Create Date: 2026-08-31 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4b92e17d5a8"  # pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = "a7c91d20e4f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "election_ballot_entries",
+        sa.Column("election_id", sa.Integer(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("book_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["election_id"], ["elections.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["book_id"], ["books.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("election_id", "position"),
+    )
+    # The appearance-count aggregation groups by book_id.
+    op.create_index(
+        "election_ballot_entries_book_id_idx",
+        "election_ballot_entries",
+        ["book_id"],
+    )
+    # Backfill from the JSON ballots already on elections.
+    op.execute(
+        sa.text(
+            "INSERT INTO election_ballot_entries (election_id, position, book_id) "
+            "SELECT e.id, entry.ordinality - 1, entry.value::integer "
+            "FROM elections AS e, "
+            "json_array_elements_text(e.ballot) WITH ORDINALITY AS entry"
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "election_ballot_entries_book_id_idx",
+        table_name="election_ballot_entries",
+    )
+    op.drop_table("election_ballot_entries")
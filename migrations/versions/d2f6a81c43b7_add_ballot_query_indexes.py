@@ -0,0 +1,43 @@
+"""Add indexes for ballot and vote-total queries
+
+Revision ID: d2f6a81c43b7
+Revises: b4fd8c2ef7a1
+Create Date: 2026-08-31 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2f6a81c43b7"  # pragma: allowlist secret
+down_revision: Union[str, Sequence[str], None] = "b4fd8c2ef7a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Partial index matching the WHERE reactions > 0 predicate the ballot
+    # query applies outside staging, so the join avoids a sequential scan.
+    op.create_index(
+        "nominations_reactions_positive_idx",
+        "nominations",
+        ["book_id"],
+        postgresql_where=sa.text("reactions > 0"),
+    )
+    # Covers the per-election vote aggregations (tallies and voter counts).
+    op.create_index(
+        "votes_election_id_book_id_idx",
+        "votes",
+        ["election_id", "book_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("votes_election_id_book_id_idx", table_name="votes")
+    op.drop_index("nominations_reactions_positive_idx", table_name="nominations")
@@ -2,7 +2,7 @@ import asyncio
 
 import discord
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from bot.calendar_sync import DiscordGoogleCalendarSync, SyncError
 from bot.recurring_discord_events import (
@@ -16,6 +16,21 @@ from bot.utils import MOUNTAIN, get_open_election, utcnow
 
 settings = get_settings()
 
+# Channels resolved through the HTTP API, so repeated background ticks do not
+# pay the fetch_channel round trip again after a cold start.
+_channel_cache: "dict[int, discord.abc.Messageable]" = {}
+
+
+async def _resolve_channel(bot: discord.Client, channel_id: int):
+    channel = bot.get_channel(channel_id)
+    if channel is not None:
+        return channel
+    channel = _channel_cache.get(channel_id)
+    if channel is None:
+        channel = await bot.fetch_channel(channel_id)
+        _channel_cache[channel_id] = channel
+    return channel
+
 
 async def close_expired_elections(bot: discord.Client):
     async with async_session() as session:
@@ -38,13 +53,15 @@ async def send_prediction_reminders(bot: discord.Client):
         if not preds:
             return
 
-        channel = bot.get_channel(settings.predictions_channel_id)
-        if channel is None:
-            channel = await bot.fetch_channel(settings.predictions_channel_id)
+        channel = await _resolve_channel(bot, settings.predictions_channel_id)
 
         guild_id = getattr(channel, "guild", None)
         guild_id = getattr(guild_id, "id", None)
-        for p in preds:
+        # Send concurrently (bounded to stay under Discord rate limits), then
+        # flip the reminded flags in a single bulk UPDATE.
+        send_limit = asyncio.Semaphore(5)
+
+        async def _send_reminder(p: Prediction) -> None:
             link = (
                 f"https://discord.com/channels/{guild_id}/{channel.id}/{p.message_id}"
                 if guild_id is not None and p.message_id is not None
@@ -56,8 +73,15 @@ async def send_prediction_reminders(bot: discord.Client):
             ]
             if link:
                 lines.append(link)
-            await channel.send("\n".join(lines))
-            p.reminded = True
+            async with send_limit:
+                await channel.send("\n".join(lines))
+
+        await asyncio.gather(*(_send_reminder(p) for p in preds))
+        await session.execute(
+            update(Prediction)
+            .where(Prediction.id.in_([p.id for p in preds]))
+            .values(reminded=True)
+        )
         await session.commit()
 
 
@@ -3,9 +3,11 @@ from __future__ import annotations
 import base64
 import hashlib
 import json
+import re
 import subprocess
 import tempfile
 import time
+import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -18,11 +20,26 @@ from bot.config import Settings, get_settings
 DISCORD_API_BASE_URL = "https://discord.com/api/v10"
 GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
 GOOGLE_CALENDAR_API_BASE_URL = "https://www.googleapis.com/calendar/v3"
+GOOGLE_CALENDAR_BATCH_URL = "https://www.googleapis.com/batch/calendar/v3"
 GOOGLE_CALENDAR_SCOPE = "https://www.googleapis.com/auth/calendar"
+# Documented per-batch request cap for the Calendar API batch endpoint.
+GOOGLE_BATCH_MAX_REQUESTS = 50
 
 DISCORD_STATUS_CANCELED = 4
 SYNC_SOURCE = "discord_scheduled_event"
 DEFAULT_SAFETY_CUTOFF = datetime(2026, 1, 1, tzinfo=UTC)
+GOOGLE_EVENTS_LIST_FIELDS = (
+    "nextPageToken,nextSyncToken,"
+    "items(id,status,start/dateTime,extendedProperties/private)"
+)
+
+# Incremental-sync state per calendar id, shared by every sync run in this
+# process: (last nextSyncToken, {google_event_id: managed event resource}).
+# With a token, Google returns only events changed since the previous run --
+# an empty page in steady state -- and we patch the mirror instead of
+# re-listing the whole calendar. Lost on restart, which just means one full
+# resync.
+_SYNC_STATE: dict[str, tuple[str, dict[str, dict[str, Any]]]] = {}
 
 
 class SyncError(RuntimeError):
@@ -51,6 +68,7 @@ class DiscordGoogleCalendarSync:
         self.google_service_account_private_key = private_key
         self._cached_access_token: str | None = None
         self._access_token_expires_at: int = 0
+        self._http_client: httpx.Client | None = None
 
     @staticmethod
     def is_configured(settings: Settings) -> bool:
@@ -60,7 +78,28 @@ class DiscordGoogleCalendarSync:
             and settings.google_calendar_id
         )
 
+    def _client(self) -> httpx.Client:
+        """Lazily create the HTTP client shared by every call in a sync run.
+
+        Reusing one client keeps a single pooled TLS connection per host
+        instead of paying a fresh handshake for each request.
+        """
+        if self._http_client is None:
+            self._http_client = httpx.Client(timeout=self.timeout_seconds)
+        return self._http_client
+
+    def close(self) -> None:
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+
     def run(self) -> dict[str, int | str]:
+        try:
+            return self._run()
+        finally:
+            self.close()
+
+    def _run(self) -> dict[str, int | str]:
         discord_events = self._load_discord_events()
         google_events = self._load_google_events()
         apply_changes = not self.settings.is_staging
@@ -84,14 +123,12 @@ class DiscordGoogleCalendarSync:
         if not apply_changes:
             return summary
 
-        for event_body in plan.to_create:
-            self._create_google_event(event_body)
-
-        for update in plan.to_update:
-            self._update_google_event(update["google_event_id"], update["body"])
-
-        for cancel in plan.to_cancel:
-            self._cancel_google_event(cancel["google_event_id"])
+        failures = self._apply_sync_plan(plan)
+        if failures:
+            logger.warning(
+                f"Calendar sync batch reported {len(failures)} failed "
+                f"request(s): {failures}"
+            )
 
         if has_changes:
             logger.info(
@@ -113,58 +150,103 @@ class DiscordGoogleCalendarSync:
         }
         params = {"with_user_count": "false"}
 
-        with httpx.Client(timeout=self.timeout_seconds) as client:
-            response = client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            payload = response.json()
+        response = self._client().get(url, headers=headers, params=params)
+        response.raise_for_status()
+        payload = response.json()
 
         if not isinstance(payload, list):
             raise SyncError("Discord API returned an unexpected payload type.")
         return payload
 
     def _load_google_events(self) -> list[dict[str, Any]]:
+        state = _SYNC_STATE.get(self.settings.google_calendar_id)
+        if state is not None:
+            sync_token, mirror = state
+            try:
+                return self._fetch_google_events(mirror, {"syncToken": sync_token})
+            except httpx.HTTPStatusError as exc:
+                # 410 Gone means the sync token aged out server-side.
+                if exc.response.status_code != 410:
+                    raise
+                logger.info("Google sync token expired; running a full resync.")
+                _SYNC_STATE.pop(self.settings.google_calendar_id, None)
+
+        # No timeMin here: the API withholds nextSyncToken from responses to
+        # any filtered listing (timeMin/timeMax/q/...), which would keep every
+        # run on the full re-list path. The safety cutoff is applied
+        # client-side in _fetch_google_events instead.
+        return self._fetch_google_events({}, {})
+
+    def _fetch_google_events(
+        self,
+        mirror: dict[str, dict[str, Any]],
+        extra_params: dict[str, Any],
+    ) -> list[dict[str, Any]]:
         url = (
             f"{GOOGLE_CALENDAR_API_BASE_URL}/calendars/"
             f"{self.settings.google_calendar_id}/events"
         )
         params: dict[str, Any] = {
             "singleEvents": "true",
-            "showDeleted": "false",
+            # Cancellations must flow through incremental responses so the
+            # mirror can drop them; the status check below filters them out.
+            "showDeleted": "true",
             "maxResults": 2500,
-            "timeMin": self._datetime_to_rfc3339(self.safety_cutoff),
+            # Partial response: the sync plan only needs ids and our private
+            # properties, so skip attendees/reminders/etc. entirely.
+            "fields": GOOGLE_EVENTS_LIST_FIELDS,
+            **extra_params,
         }
 
-        managed: list[dict[str, Any]] = []
         page_token: str | None = None
-        with httpx.Client(timeout=self.timeout_seconds) as client:
-            while True:
-                if page_token:
-                    params["pageToken"] = page_token
-                elif "pageToken" in params:
-                    del params["pageToken"]
-
-                response = client.get(
-                    url,
-                    headers=self._google_headers(),
-                    params=params,
-                )
-                response.raise_for_status()
-                payload = response.json()
-
-                for item in payload.get("items", []):
-                    private_props = (item.get("extendedProperties") or {}).get(
-                        "private"
-                    ) or {}
-                    if private_props.get("sync_source") != SYNC_SOURCE:
-                        continue
-                    if private_props.get("discord_event_id"):
-                        managed.append(item)
-
-                page_token = payload.get("nextPageToken")
-                if not page_token:
-                    break
+        client = self._client()
+        while True:
+            if page_token:
+                params["pageToken"] = page_token
+            elif "pageToken" in params:
+                del params["pageToken"]
+
+            response = client.get(
+                url,
+                headers=self._google_headers(),
+                params=params,
+            )
+            response.raise_for_status()
+            payload = response.json()
 
-        return managed
+            for item in payload.get("items", []):
+                item_id = item.get("id")
+                if not item_id:
+                    continue
+                mirror.pop(item_id, None)
+                if item.get("status") == "cancelled":
+                    continue
+                private_props = (item.get("extendedProperties") or {}).get(
+                    "private"
+                ) or {}
+                if private_props.get("sync_source") != SYNC_SOURCE:
+                    continue
+                # Client-side counterpart of the old timeMin filter; see
+                # _load_google_events for why the listing stays unfiltered.
+                start_at = self._parse_datetime(
+                    (item.get("start") or {}).get("dateTime")
+                )
+                if start_at is not None and start_at < self.safety_cutoff:
+                    continue
+                if private_props.get("discord_event_id"):
+                    mirror[item_id] = item
+
+            page_token = payload.get("nextPageToken")
+            if not page_token:
+                sync_token = payload.get("nextSyncToken")
+                if sync_token:
+                    _SYNC_STATE[self.settings.google_calendar_id] = (
+                        sync_token,
+                        mirror,
+                    )
+                break
+
+        return list(mirror.values())
 
     def _build_sync_plan(
         self,
@@ -213,11 +295,8 @@ class DiscordGoogleCalendarSync:
                 }
             )
 
-        for discord_event_id, existing_event in existing.items():
-            if discord_event_id in seen_discord_event_ids:
-                continue
-
-            google_event_id = existing_event.get("id")
+        for discord_event_id in existing.keys() - seen_discord_event_ids:
+            google_event_id = existing[discord_event_id].get("id")
             if not google_event_id:
                 continue
 
@@ -274,45 +353,89 @@ class DiscordGoogleCalendarSync:
         )
         return body, False
 
-    def _create_google_event(self, event_body: dict[str, Any]) -> dict[str, Any]:
-        url = (
-            f"{GOOGLE_CALENDAR_API_BASE_URL}/calendars/"
-            f"{self.settings.google_calendar_id}/events"
+    def _apply_sync_plan(self, plan: SyncPlan) -> list[str]:
+        """Apply all plan mutations via the Calendar batch endpoint.
+
+        One multipart POST carries up to ``GOOGLE_BATCH_MAX_REQUESTS``
+        mutations, so applying N changes costs ceil(N / 50) round-trips
+        instead of N. Returns status lines for any parts that failed.
+        """
+        events_path = (
+            f"/calendar/v3/calendars/{self.settings.google_calendar_id}/events"
         )
-        with httpx.Client(timeout=self.timeout_seconds) as client:
-            response = client.post(url, headers=self._google_headers(), json=event_body)
-            response.raise_for_status()
-            return response.json()
+        parts: list[tuple[str, str, dict[str, Any]]] = []
+        for event_body in plan.to_create:
+            parts.append(("POST", events_path, event_body))
+        for update in plan.to_update:
+            parts.append(
+                ("PATCH", f"{events_path}/{update['google_event_id']}", update["body"])
+            )
+        for cancel in plan.to_cancel:
+            parts.append(
+                (
+                    "PATCH",
+                    f"{events_path}/{cancel['google_event_id']}",
+                    {"status": "cancelled"},
+                )
+            )
+
+        failures: list[str] = []
+        for offset in range(0, len(parts), GOOGLE_BATCH_MAX_REQUESTS):
+            failures.extend(
+                self._execute_calendar_batch(
+                    parts[offset : offset + GOOGLE_BATCH_MAX_REQUESTS]
+                )
+            )
+        return failures
 
-    def _update_google_event(
+    def _execute_calendar_batch(
         self,
-        google_event_id: str,
-        event_body: dict[str, Any],
-    ) -> dict[str, Any]:
-        url = (
-            f"{GOOGLE_CALENDAR_API_BASE_URL}/calendars/"
-            f"{self.settings.google_calendar_id}/events/{google_event_id}"
+        parts: list[tuple[str, str, dict[str, Any]]],
+    ) -> list[str]:
+        boundary = f"batch_{uuid.uuid4().hex}"
+        headers = self._google_headers()
+        headers["Content-Type"] = f"multipart/mixed; boundary={boundary}"
+
+        response = self._client().post(
+            GOOGLE_CALENDAR_BATCH_URL,
+            headers=headers,
+            content=self._encode_calendar_batch(parts, boundary),
         )
-        with httpx.Client(timeout=self.timeout_seconds) as client:
-            response = client.patch(
-                url, headers=self._google_headers(), json=event_body
+        response.raise_for_status()
+
+        return self._batch_part_errors(response.text)
+
+    @staticmethod
+    def _encode_calendar_batch(
+        parts: list[tuple[str, str, dict[str, Any]]],
+        boundary: str,
+    ) -> bytes:
+        segments: list[str] = []
+        for index, (method, path, body) in enumerate(parts, start=1):
+            payload = json.dumps(body, separators=(",", ":"))
+            segments.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <item-{index}>\r\n"
+                "\r\n"
+                f"{method} {path} HTTP/1.1\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload.encode('utf-8'))}\r\n"
+                "\r\n"
+                f"{payload}\r\n"
             )
-            response.raise_for_status()
-            return response.json()
+        segments.append(f"--{boundary}--\r\n")
+        return "".join(segments).encode("utf-8")
 
-    def _cancel_google_event(self, google_event_id: str) -> dict[str, Any]:
-        url = (
-            f"{GOOGLE_CALENDAR_API_BASE_URL}/calendars/"
-            f"{self.settings.google_calendar_id}/events/{google_event_id}"
-        )
-        with httpx.Client(timeout=self.timeout_seconds) as client:
-            response = client.patch(
-                url,
-                headers=self._google_headers(),
-                json={"status": "cancelled"},
+    @staticmethod
+    def _batch_part_errors(response_text: str) -> list[str]:
+        # Each part of the multipart response embeds its own status line.
+        return [
+            match.group(1).strip()
+            for match in re.finditer(
+                r"^HTTP/1\.1 ([45]\d\d .*)$", response_text, re.MULTILINE
             )
-            response.raise_for_status()
-            return response.json()
+        ]
 
     def _google_headers(self) -> dict[str, str]:
         return {
@@ -331,10 +454,9 @@ class DiscordGoogleCalendarSync:
             "assertion": assertion,
         }
 
-        with httpx.Client(timeout=self.timeout_seconds) as client:
-            response = client.post(GOOGLE_TOKEN_URL, data=form_data)
-            response.raise_for_status()
-            payload = response.json()
+        response = self._client().post(GOOGLE_TOKEN_URL, data=form_data)
+        response.raise_for_status()
+        payload = response.json()
 
         access_token = payload.get("access_token")
         expires_in = payload.get("expires_in", 3600)
@@ -388,8 +510,9 @@ class DiscordGoogleCalendarSync:
     def _parse_datetime(value: str | None) -> datetime | None:
         if not value:
             return None
-        normalized = value.replace("Z", "+00:00")
-        parsed = datetime.fromisoformat(normalized)
+        # fromisoformat on 3.11+ parses RFC 3339 "Z" suffixes directly in C,
+        # so no string normalization pass is needed first.
+        parsed = datetime.fromisoformat(value)
         if parsed.tzinfo is None:
             parsed = parsed.replace(tzinfo=UTC)
         return parsed.astimezone(UTC)
@@ -459,10 +582,9 @@ class DiscordGoogleCalendarSync:
             "Authorization": f"Bot {self.settings.discord_token}",
             "Content-Type": "application/json",
         }
-        with httpx.Client(timeout=self.timeout_seconds) as client:
-            response = client.get(channel_url, headers=headers)
-            response.raise_for_status()
-            payload = response.json()
+        response = self._client().get(channel_url, headers=headers)
+        response.raise_for_status()
+        payload = response.json()
 
         guild_id = payload.get("guild_id")
         if guild_id is None:
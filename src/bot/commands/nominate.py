@@ -1,5 +1,6 @@
 import asyncio
 import re
+from collections import OrderedDict
 from contextlib import suppress
 from typing import Any
 
@@ -26,6 +27,7 @@ LOOKUP_ERROR_MESSAGE = (
     "Failed to look up book details with OpenAI. Please try again later."
 )
 MAX_LOG_QUERY_LENGTH = 500
+LOOKUP_CACHE_MAX_SIZE = 256
 
 
 class BookLookupError(Exception):
@@ -128,6 +130,22 @@ class Nominate(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self._reaction_refresh_tasks: dict[int, asyncio.Task[None]] = {}
+        self._openai_client: AsyncOpenAI | None = None
+        self._lookup_tasks: OrderedDict[str, asyncio.Task[BookLookupResult]] = (
+            OrderedDict()
+        )
+
+    def _get_openai_client(self) -> AsyncOpenAI:
+        # One client per cog keeps the underlying HTTP connection pool warm
+        # across lookups instead of handshaking for every nomination.
+        if self._openai_client is None:
+            self._openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
+        return self._openai_client
+
+    async def cog_unload(self) -> None:
+        if self._openai_client is not None:
+            await self._openai_client.close()
+            self._openai_client = None
 
     async def _get_nomination_channel(self, channel_id: int):
         channel = None
@@ -261,14 +279,35 @@ class Nominate(commands.Cog):
             nomination = await self._create_nomination(
                 session, book, interaction.user.id
             )
-            await self._post_nomination_message(session, interaction, book, nomination)
-            await session.commit()
+            message = await self._post_nomination_message(
+                session, interaction, book, nomination
+            )
+            # The cancel reaction and the commit are independent round-trips;
+            # overlap them instead of paying each in sequence. Both must
+            # settle before the session context exits — a failed reaction
+            # would otherwise close the session mid-commit — so collect
+            # exceptions and re-raise the first afterwards.
+            results = await asyncio.gather(
+                message.add_reaction(NOMINATION_CANCEL_EMOJI),
+                session.commit(),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
 
-        await interaction.followup.send(f"Nominated *{book.title}*", ephemeral=True)
+        confirmation = interaction.followup.send(
+            f"Nominated *{book.title}*", ephemeral=True
+        )
         if interaction.channel.id != settings.nom_channel_id:
-            await interaction.channel.send(
-                f"{interaction.user.mention} nominated *{book.title}*"
+            await asyncio.gather(
+                confirmation,
+                interaction.channel.send(
+                    f"{interaction.user.mention} nominated *{book.title}*"
+                ),
             )
+        else:
+            await confirmation
 
     @staticmethod
     def _book_from_lookup(lookup: BookLookupResult) -> Book:
@@ -307,11 +346,13 @@ class Nominate(commands.Cog):
 
     @staticmethod
     def _nomination_embed(book: Book, nominator_mention: str) -> discord.Embed:
-        summary_text = book.summary or "No summary available."
-        summary_text += f"\n\nNominated by {nominator_mention}."
+        parts = [
+            book.summary or "No summary available.",
+            f"\n\nNominated by {nominator_mention}.",
+        ]
         if book.length:
-            summary_text += f" {book.length} pages."
-        return discord.Embed(title=book.title, description=summary_text)
+            parts.append(f" {book.length} pages.")
+        return discord.Embed(title=book.title, description="".join(parts))
 
     @staticmethod
     async def _resolve_nomination_channel(interaction: discord.Interaction):
@@ -329,7 +370,7 @@ class Nominate(commands.Cog):
         interaction: discord.Interaction,
         book: Book,
         nomination: Nomination,
-    ) -> None:
+    ) -> "discord.Message":
         channel = await self._resolve_nomination_channel(interaction)
         if channel is None:
             await session.rollback()
@@ -347,9 +388,9 @@ class Nominate(commands.Cog):
                 settings.nom_channel_id,
             )
             raise UserFacingError("Failed to post nomination. Please try again later.")
-        await message.add_reaction(NOMINATION_CANCEL_EMOJI)
         nomination.message_id = message.id
         session.add(nomination)
+        return message
 
     @staticmethod
     def _normalize_match_text(value: str | None) -> str:
@@ -405,7 +446,30 @@ class Nominate(commands.Cog):
         return (await session.execute(stmt)).scalar_one_or_none()
 
     async def lookup_book(self, query: str) -> BookLookupResult:
-        client = AsyncOpenAI(api_key=settings.openai_api_key)
+        """Resolve a nomination query, coalescing repeat lookups.
+
+        Identical queries (ignoring case and whitespace) share one cached
+        task, so a re-nomination or two users racing on the same book cost
+        a single OpenAI round-trip. Failed lookups are not kept, so the
+        next attempt retries.
+        """
+        key = " ".join(query.casefold().split())
+        task = self._lookup_tasks.get(key)
+        if task is not None and not (
+            task.done() and (task.cancelled() or task.exception() is not None)
+        ):
+            self._lookup_tasks.move_to_end(key)
+            return await task
+
+        task = asyncio.create_task(self._lookup_book_uncached(query))
+        self._lookup_tasks[key] = task
+        self._lookup_tasks.move_to_end(key)
+        while len(self._lookup_tasks) > LOOKUP_CACHE_MAX_SIZE:
+            self._lookup_tasks.popitem(last=False)
+        return await task
+
+    async def _lookup_book_uncached(self, query: str) -> BookLookupResult:
+        client = self._get_openai_client()
         log_query = _log_text(query)
         logger.info(
             "Looking up book nomination with OpenAI model={} query={!r}",
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from datetime import timezone
+import asyncio
 import discord
 from discord import app_commands
 from discord.ext import commands
+from sqlalchemy import insert
 
 from bot.config import get_settings
 from bot.db import Prediction, async_session
@@ -27,6 +28,17 @@ def _normalize_probability(probability: float) -> float:
 class Predict(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self._predictions_channel = None
+
+    async def _get_predictions_channel(self):
+        # The channel is static per process; resolve it once so a cold
+        # gateway cache costs at most one REST fetch per cog lifetime.
+        if self._predictions_channel is None:
+            channel = self.bot.get_channel(settings.predictions_channel_id)
+            if channel is None:
+                channel = await self.bot.fetch_channel(settings.predictions_channel_id)
+            self._predictions_channel = channel
+        return self._predictions_channel
 
     @app_commands.command(
         name="predict", description="Record a prediction and schedule a reminder."
@@ -58,11 +70,11 @@ class Predict(commands.Cog):
         if not prediction_text:
             raise UserFacingError("Prediction text cannot be empty.")
 
-        channel = self.bot.get_channel(settings.predictions_channel_id)
-        if channel is None:
-            channel = await self.bot.fetch_channel(settings.predictions_channel_id)
+        channel = await self._get_predictions_channel()
 
-        due_timestamp = int(due_at_local.astimezone(timezone.utc).timestamp())
+        # parse_due_datetime always returns an aware datetime, so timestamp()
+        # already yields the UTC epoch; no astimezone round-trip needed.
+        due_timestamp = int(due_at_local.timestamp())
         lines = [
             f"**Prediction from {interaction.user.mention}**",
             f"> {prediction_text}",
@@ -73,15 +85,32 @@ class Predict(commands.Cog):
         message = await channel.send(message_payload)
 
         async with async_session() as session:
-            record = Prediction(
-                predictor_discord_id=interaction.user.id,
-                text=prediction_text,
-                odds=probability_percent,
-                due_at=due_at_local.replace(tzinfo=None),
-                message_id=message.id,
+            # Core insert: this is a write-only path, so skip the ORM's
+            # identity-map and flush bookkeeping for the single row.
+            await session.execute(
+                insert(Prediction).values(
+                    predictor_discord_id=interaction.user.id,
+                    text=prediction_text,
+                    odds=probability_percent,
+                    due_at=due_at_local.replace(tzinfo=None),
+                    message_id=message.id,
+                )
             )
-            session.add(record)
-            await session.commit()
+            # The commit and the mirror message are independent round-trips;
+            # run them together instead of back to back. return_exceptions
+            # lets both settle before the session context exits — otherwise a
+            # failed send would tear the session down mid-commit — and the
+            # first failure is re-raised afterwards.
+            pending = [session.commit()]
+            if (
+                interaction.channel
+                and interaction.channel.id != settings.predictions_channel_id
+            ):
+                pending.append(interaction.channel.send(message_payload))
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
 
         link = getattr(message, "jump_url", None)
         if link is None:
@@ -92,12 +121,6 @@ class Predict(commands.Cog):
                     f"https://discord.com/channels/{guild_id}/{channel.id}/{message.id}"
                 )
 
-        if (
-            interaction.channel
-            and interaction.channel.id != settings.predictions_channel_id
-        ):
-            await interaction.channel.send(message_payload)
-
         response_lines = [f"Prediction scheduled for <t:{due_timestamp}:D>."]
         if link:
             response_lines.append(f"View it [here]({link}).")
@@ -1,31 +1,81 @@
 import asyncio
 import logging
 import re
+import time
+from math import fsum
 
 import discord
 from discord.ext import commands
+from sqlalchemy import BigInteger, Integer, Numeric, column, literal, true, values
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.future import select
 
 from bot.config import get_settings
-from bot.db import async_session, Book, Vote
+from bot.db import async_session, Book, Election, Vote
 from bot.reactions import update_election_vote_reaction
 from bot.utils import get_open_election, handle_interaction_errors, short_book_title
 
 log = logging.getLogger(__name__)
 settings = get_settings()
+# Settings are immutable after startup; bind the per-vote values once so the
+# hot path skips repeated attribute lookups.
+_WEIGHT_INNER = settings.weight_inner
+_WEIGHT_OUTER = settings.weight_outer
+# Stricter than float(): rejects nan/inf/exponent forms that would poison
+# the quadratic score check.
+_NUM_RE = re.compile(r"-?\d+(\.\d+)?")
+# Election state only changes via admin commands, so the modal's ballot can
+# be a few seconds stale without harm: the vote upsert itself re-checks the
+# open election in SQL, so a submit against a just-closed election still
+# fails cleanly.
+_BALLOT_CACHE_TTL_SECONDS = 5.0
+
+
+def _cast_votes_stmt(voter_discord_id: int, entries: dict[int, float]):
+    """Upsert all vote entries against the open election in one statement.
+
+    The entries join a subquery selecting the currently open election, so the
+    insert returns no rows when voting is closed.
+    """
+
+    vote_rows = values(
+        column("book_id", Integer), column("weight", Numeric), name="vote_entries"
+    ).data(list(entries.items()))
+    open_election = (
+        select(Election.id.label("election_id"))
+        .where(Election.closed_at.is_(None))
+        .order_by(Election.opened_at.desc())
+        .limit(1)
+        .subquery("open_election")
+    )
+    source = select(
+        open_election.c.election_id,
+        literal(voter_discord_id, BigInteger),
+        vote_rows.c.book_id,
+        vote_rows.c.weight,
+    ).join_from(open_election, vote_rows, true())
+    stmt = insert(Vote).from_select(
+        ["election_id", "voter_discord_id", "book_id", "weight"], source
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[Vote.election_id, Vote.voter_discord_id, Vote.book_id],
+        set_={"weight": stmt.excluded.weight},
+    ).returning(Vote.election_id)
 
 
 class BallotModal(discord.ui.Modal, title="Vote"):
     def __init__(self, noms: list[Book], is_bookclub: bool = False):
         super().__init__()
         self.is_bookclub = is_bookclub
-        self.title = f"Points to distribute: {settings.weight_inner if is_bookclub else settings.weight_outer}"
+        self.title = (
+            f"Points to distribute: {_WEIGHT_INNER if is_bookclub else _WEIGHT_OUTER}"
+        )
         self.noms = noms
-        for nom in noms:
-            self.add_item(
+        add_item = self.add_item
+        for label in [short_book_title(nom.title)[:45] for nom in noms]:
+            add_item(
                 discord.ui.TextInput(
-                    label=short_book_title(nom.title)[:45],
+                    label=label,
                     required=False,
                     placeholder="0-10",
                     default="0",
@@ -33,39 +83,28 @@ class BallotModal(discord.ui.Modal, title="Vote"):
             )
 
     async def record_votes(self, interaction: discord.Interaction, entries):
-        max_score = settings.weight_inner if self.is_bookclub else settings.weight_outer
+        max_score = _WEIGHT_INNER if self.is_bookclub else _WEIGHT_OUTER
+        if fsum(v * v for v in entries.values()) > max_score:
+            raise Exception(
+                f"Total score exceeds maximum allowed ({max_score}). "
+                f"Quadratic scoring is used, so scores are squared before summing. "
+                f"i.e., if you cast 3, 3, and 2, the total is 3²+3²+2²=22."
+            )
         async with async_session() as session:
-            election = await get_open_election(session)
-            if not election:
-                raise Exception("Voting is not currently open.")
-            if sum(v**2 for v in entries.values()) > max_score:
-                raise Exception(
-                    f"Total score exceeds maximum allowed ({max_score}). "
-                    f"Quadratic scoring is used, so scores are squared before summing. "
-                    f"i.e., if you cast 3, 3, and 2, the total is 3²+3²+2²=22."
-                )
-            for book_id, score in entries.items():
-                stmt = (
-                    insert(Vote)
-                    .values(
-                        election_id=election.id,
-                        voter_discord_id=interaction.user.id,
-                        book_id=book_id,
-                        weight=score,
-                    )
-                    .on_conflict_do_update(
-                        index_elements=[
-                            Vote.election_id,
-                            Vote.voter_discord_id,
-                            Vote.book_id,
-                        ],
-                        set_={"weight": score},
-                    )
+            if entries:
+                # One round trip: the upsert selects the open election itself
+                # and returns its id, so a closed election yields no rows.
+                result = await session.execute(
+                    _cast_votes_stmt(interaction.user.id, entries)
                 )
-                await session.execute(stmt)
+                election_id = result.scalars().first()
+            else:
+                election = await get_open_election(session)
+                election_id = election.id if election else None
+            if election_id is None:
+                raise Exception("Voting is not currently open.")
 
             await session.commit()
-            election_id = election.id
 
         try:
             await update_election_vote_reaction(interaction.client, election_id)
@@ -77,7 +116,7 @@ class BallotModal(discord.ui.Modal, title="Vote"):
         entries = {}
         for comp, nom in zip(self.children, self.noms):
             txt = comp.value.strip() or "0"
-            if not re.fullmatch(r"-?\d+(\.\d+)?", txt):
+            if not _NUM_RE.fullmatch(txt):
                 log.info(
                     "vote_failed",
                     extra={"user": str(inter.user), "reason": "non-numeric input"},
@@ -108,16 +147,29 @@ class BallotModal(discord.ui.Modal, title="Vote"):
 class Ballot(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self._ballot_cache: tuple[float, object, list | None] | None = None
+        self._ballot_lock = asyncio.Lock()
 
     async def _load_ballot(self):
-        async with async_session() as session:
-            election = await get_open_election(session)
-            if not election:
-                return None, None
-            books_result = await session.execute(
-                select(Book).where(Book.id.in_(election.ballot))
-            )
-            books = books_result.scalars().all()
+        cached = self._ballot_cache
+        if cached and time.monotonic() - cached[0] < _BALLOT_CACHE_TTL_SECONDS:
+            return cached[1], cached[2]
+        # The lock keeps a burst of /vote calls from stampeding the DB with
+        # identical queries; losers of the race reuse the winner's result.
+        async with self._ballot_lock:
+            cached = self._ballot_cache
+            if cached and time.monotonic() - cached[0] < _BALLOT_CACHE_TTL_SECONDS:
+                return cached[1], cached[2]
+            async with async_session() as session:
+                election = await get_open_election(session)
+                if not election:
+                    books = None
+                else:
+                    books_result = await session.execute(
+                        select(Book).where(Book.id.in_(election.ballot))
+                    )
+                    books = books_result.scalars().all()
+            self._ballot_cache = (time.monotonic(), election, books)
         return election, books
 
     @discord.app_commands.command(
@@ -135,7 +187,8 @@ class Ballot(commands.Cog):
             )
             return
         # sort books to be in same order as ballot
-        books.sort(key=lambda b: election.ballot.index(b.id))
+        ballot_order = {book_id: idx for idx, book_id in enumerate(election.ballot)}
+        books.sort(key=lambda b: ballot_order[b.id])
         user_roles = [r.id for r in interaction.user.roles]
         is_bookclub = settings.role_highweight_id in user_roles
         await interaction.response.send_modal(
@@ -1,16 +1,34 @@
 import asyncio
 from datetime import timedelta, datetime, timezone
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 import discord
 from discord import app_commands, Permissions
 from discord.ext import commands
 from loguru import logger
-from sqlalchemy import select, func, Integer, cast
+from sqlalchemy import (
+    ARRAY,
+    any_,
+    bindparam,
+    exists,
+    func,
+    insert,
+    select,
+    update,
+    Integer,
+)
 
 from bot.config import get_settings
-from bot.db import async_session, Nomination, Election, Vote, Book
+from bot.db import (
+    async_session,
+    Book,
+    Election,
+    ElectionBallotEntry,
+    Nomination,
+    Vote,
+)
 from bot.reactions import update_election_vote_reaction, DiscordNotFound
 from bot.election import close_and_tally, get_election_vote_totals
 from bot.utils import (
@@ -18,6 +36,7 @@ from bot.utils import (
     format_vote_count,
     get_open_election,
     handle_interaction_errors,
+    open_election_exists,
     nomination_message_url,
     utcnow,
     short_book_title,
@@ -25,6 +44,83 @@ from bot.utils import (
 )
 
 settings = get_settings()
+# Bound once at import; settings are immutable after startup.
+_IS_STAGING = settings.is_staging
+_MAX_APPEARANCES = settings.max_election_appearances
+
+
+@lru_cache(maxsize=4)
+def _top_noms_stmt(*, require_reactions: bool, max_appearances: int):
+    """Build the top-nominations statement once per settings combination."""
+
+    sub_votes = (
+        select(Vote.book_id, func.sum(Vote.weight).label("vote_sum"))
+        .group_by(Vote.book_id)
+        .subquery()
+    )
+    nominations_table = Nomination.__table__
+    # Counting over the normalized entry table lets the planner use its
+    # book_id index instead of re-unnesting every election's JSON ballot.
+    ballot_entries_table = ElectionBallotEntry.__table__
+    appearance_totals = (
+        select(
+            ballot_entries_table.c.book_id,
+            func.count().label("appearance_count"),
+        )
+        .join(Election, Election.id == ballot_entries_table.c.election_id)
+        .where(Election.winner.is_not(None))
+        .group_by(ballot_entries_table.c.book_id)
+        .cte("appearance_totals")
+    )
+    appearance_count_expr = func.coalesce(appearance_totals.c.appearance_count, 0)
+    score_expr = func.coalesce(nominations_table.c.reactions, 0) + func.coalesce(
+        sub_votes.c.vote_sum, 0
+    )
+    stmt = (
+        select(
+            Book.id.label("book_id"),
+            Book.title.label("title"),
+            Book.summary.label("summary"),
+            Book.created_at.label("created_at"),
+            nominations_table.c.message_id.label("message_id"),
+            func.coalesce(nominations_table.c.reactions, 0).label("reactions"),
+            func.coalesce(sub_votes.c.vote_sum, 0).label("vote_sum"),
+            score_expr.label("score"),
+            appearance_count_expr.label("appearance_count"),
+        )
+        .select_from(Book)
+        .outerjoin(nominations_table, nominations_table.c.book_id == Book.id)
+        .outerjoin(sub_votes, sub_votes.c.book_id == Book.id)
+        .outerjoin(appearance_totals, appearance_totals.c.book_id == Book.id)
+        # Correlated NOT EXISTS instead of NOT IN: no materialized winner
+        # list, and NULL winners need no special casing.
+        .where(~exists().where(Election.winner == Book.id))
+    )
+    if require_reactions:
+        stmt = stmt.where(func.coalesce(nominations_table.c.reactions, 0) > 0)
+    # Rank in SQL so Postgres does the top-N sort and only ships the rows we
+    # keep: the current top scorer leads even if it has prior appearances,
+    # then fresh nominees, then score, with nomination age as the tiebreak.
+    return stmt.where(appearance_count_expr < max_appearances).order_by(
+        (score_expr != func.max(score_expr).over()).asc(),
+        (appearance_count_expr > 0).asc(),
+        score_expr.desc(),
+        Book.created_at.asc(),
+    )
+
+
+# A single array parameter instead of an expanding IN keeps the SQL text
+# identical across ballot sizes, so the compiled-statement cache and
+# asyncpg's prepared statements hit on every call.
+_BALLOT_IDS_PARAM = bindparam("ballot_ids", type_=ARRAY(Integer))
+_BALLOT_ENTRIES_STMT = (
+    select(Book.id, Book.title, Book.summary, Nomination.message_id)
+    .outerjoin(Nomination, Nomination.book_id == Book.id)
+    .where(Book.id == any_(_BALLOT_IDS_PARAM))
+)
+_BALLOT_BOOKS_STMT = select(Book.id, Book.title).where(
+    Book.id == any_(_BALLOT_IDS_PARAM)
+)
 
 
 @dataclass(slots=True)
@@ -35,24 +131,47 @@ class BallotNominee:
     score: float
     prior_appearances: int
     created_at: datetime
+    # Render fields carried along by the ranking query so callers can build
+    # embeds without a second book/nomination lookup.
+    title: str = ""
+    summary: Optional[str] = None
+    message_id: Optional[int] = None
 
 
 @dataclass(slots=True)
 class BallotEntryDetails:
-    book: Book
-    nomination: Optional[Nomination]
+    book_id: int
+    title: str
+    summary: Optional[str]
     jump_url: Optional[str]
 
 
-@dataclass(slots=True)
-class VoteSummary:
-    total_votes: float
-    text: str
-
-
 class VotingSession(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # Channel ids never change within a process, so cache each resolved
+        # channel and pay the fetch_channel REST round-trip at most once.
+        self._channel_cache: dict[int, object] = {}
+
+    async def _get_channel(
+        self, channel_id: int, client: Optional[discord.Client] = None
+    ):
+        channel = self._channel_cache.get(channel_id)
+        if channel is None:
+            source = client if client is not None else self.bot
+            if hasattr(source, "get_channel"):
+                channel = source.get_channel(channel_id)
+            if channel is None and hasattr(source, "fetch_channel"):
+                channel = await source.fetch_channel(channel_id)
+            if channel is not None:
+                self._channel_cache[channel_id] = channel
+        return channel
+
+    async def _get_nom_channel(self):
+        return await self._get_channel(settings.nom_channel_id)
+
+    async def _get_bookclub_channel(self, client: discord.Client):
+        return await self._get_channel(settings.bookclub_channel_id, client=client)
 
     @staticmethod
     def _build_election_description(closes_at: datetime) -> str:
@@ -80,163 +199,157 @@ class VotingSession(commands.Cog):
         if not ballot_ids:
             return []
 
-        nominations_result = await session.execute(
-            select(Nomination).where(Nomination.book_id.in_(ballot_ids))
-        )
-        nominations_by_book = {
-            nomination.book_id: nomination
-            for nomination in nominations_result.scalars()
-        }
-        books_result = await session.execute(
-            select(Book).where(Book.id.in_(ballot_ids))
-        )
-        books_by_id = {book.id: book for book in books_result.scalars()}
+        # One outer-joined query instead of separate Nomination and Book
+        # round-trips, and only the columns the embeds render: wide unused
+        # Text columns like Book.description never cross the wire.
+        result = await session.execute(_BALLOT_ENTRIES_STMT, {"ballot_ids": ballot_ids})
+        rows_by_book = {row.id: row for row in result}
 
         entries: list[BallotEntryDetails] = []
         for bid in ballot_ids:
-            book = books_by_id.get(bid)
-            if not book:
+            row = rows_by_book.get(bid)
+            if row is None:
                 continue
-            nomination = nominations_by_book.get(bid)
             jump_url = (
-                nomination_message_url(nomination.message_id, guild_id)
-                if nomination
+                nomination_message_url(row.message_id, guild_id)
+                if row.message_id is not None
                 else None
             )
             entries.append(
-                BallotEntryDetails(book=book, nomination=nomination, jump_url=jump_url)
+                BallotEntryDetails(
+                    book_id=row.id,
+                    title=row.title,
+                    summary=row.summary,
+                    jump_url=jump_url,
+                )
             )
         return entries
 
-    async def get_reacts_for_nomination(self, nomination: Nomination) -> int:
+    async def get_reacts_for_nomination(
+        self, nomination: Nomination, channel=None, message=None
+    ) -> int:
         """Get the number of unique users who reacted to a nomination."""
-        channel = self.bot.get_channel(settings.nom_channel_id)
-        if not channel:
-            channel = await self.bot.fetch_channel(settings.nom_channel_id)
-        try:
-            message = await channel.fetch_message(nomination.message_id)
-        except discord.NotFound:
-            logger.warning(
-                "Nomination message {} for book {} no longer exists; defaulting reactions to 0",
-                nomination.message_id,
-                nomination.book_id,
-            )
+        if message is None:
+            if channel is None:
+                channel = await self._get_nom_channel()
+            try:
+                message = await channel.fetch_message(nomination.message_id)
+            except discord.NotFound:
+                logger.warning(
+                    "Nomination message {} for book {} no longer exists; defaulting reactions to 0",
+                    nomination.message_id,
+                    nomination.book_id,
+                )
+                return 0
+
+        relevant = [
+            reaction
+            for reaction in message.reactions
+            if str(getattr(reaction, "emoji", reaction)) != NOMINATION_CANCEL_EMOJI
+        ]
+        if not relevant:
             return 0
 
-        unique_users = set()
-        for reaction in message.reactions:
-            emoji = getattr(reaction, "emoji", reaction)
-            if str(emoji) == NOMINATION_CANCEL_EMOJI:
-                continue
-            async for user in reaction.users():
-                unique_users.add(user.id)
+        async def _reactor_ids(reaction) -> set[int]:
+            return {user.id async for user in reaction.users()}
+
+        # Page through each emoji's reactors concurrently; the dedup across
+        # emojis (and the nominator exclusion) must stay exact because the
+        # count feeds ballot scoring.
+        user_sets = await asyncio.gather(*(_reactor_ids(r) for r in relevant))
+        unique_users = set().union(*user_sets)
         return len(unique_users - {nomination.nominator_discord_id})
 
     async def update_all_nominations(self, session):
-        nominations = await session.execute(select(Nomination))
-        nominations = nominations.scalars().all()
+        channel = await self._get_nom_channel()
+        # One bulk history sweep resolves most nomination messages up front;
+        # only messages older than the window fall back to fetch_message.
+        cached_messages = {}
+        history = getattr(channel, "history", None)
+        if history is not None:
+            async for message in history(limit=500):
+                cached_messages[message.id] = message
+        # Bounded fan-out: enough parallelism to hide REST latency without
+        # stampeding Discord's rate limiter into 429 retries.
+        semaphore = asyncio.Semaphore(8)
 
         async def update_nom(nomination):
-            nomination.reactions = await self.get_reacts_for_nomination(nomination)
-            session.add(nomination)
-
-        await asyncio.gather(*(update_nom(n) for n in nominations))
-        await session.commit()
-
-    async def get_top_noms(self, session, limit: int = 0) -> list[BallotNominee]:
-        sub_votes = (
-            select(Vote.book_id, func.sum(Vote.weight).label("vote_sum"))
-            .group_by(Vote.book_id)
-            .subquery()
-        )
-        nominations_table = Nomination.__table__
-        winner_subq = (
-            select(Election.winner)
-            .where(Election.winner.is_not(None))
-            .scalar_subquery()
-        )
-        ballot_entries = (
-            select(
-                cast(func.json_array_elements_text(Election.ballot), Integer).label(
-                    "book_id"
+            async with semaphore:
+                count = await self.get_reacts_for_nomination(
+                    nomination,
+                    channel=channel,
+                    message=cached_messages.get(nomination.message_id),
                 )
-            )
-            .select_from(Election)
-            .where(Election.winner.is_not(None))
-            .cte("ballot_entries")
+            return nomination, count
+
+        # Stream rows instead of materializing the whole table; the Discord
+        # fetches start overlapping the scan as soon as rows arrive, and
+        # yield_per keeps the driver's buffer to one chunk of ORM rows.
+        tasks = []
+        stream = await session.stream_scalars(
+            select(Nomination).execution_options(yield_per=100)
         )
-        appearance_totals = (
-            select(
-                ballot_entries.c.book_id,
-                func.count().label("appearance_count"),
-            )
-            .group_by(ballot_entries.c.book_id)
-            .cte("appearance_totals")
+        async for nomination in stream:
+            tasks.append(asyncio.create_task(update_nom(nomination)))
+        if not tasks:
+            return
+        results = await asyncio.gather(*tasks)
+        # The workers only read from Discord; the shared session sees a
+        # single executemany UPDATE instead of N concurrently-dirtied rows.
+        # Rows whose count did not move are skipped entirely, so a sweep
+        # over a quiet channel writes nothing.
+        params = [
+            {"b_id": nomination.id, "b_reactions": count}
+            for nomination, count in results
+            if count != nomination.reactions
+        ]
+        if not params:
+            return
+        await session.execute(
+            update(Nomination)
+            .where(Nomination.id == bindparam("b_id"))
+            .values(reactions=bindparam("b_reactions")),
+            params,
         )
-        appearance_count_expr = func.coalesce(appearance_totals.c.appearance_count, 0)
-        max_appearances = settings.max_election_appearances
-        stmt = (
-            select(
-                Book.id.label("book_id"),
-                Book.created_at.label("created_at"),
-                func.coalesce(nominations_table.c.reactions, 0).label("reactions"),
-                func.coalesce(sub_votes.c.vote_sum, 0).label("vote_sum"),
-                (
-                    func.coalesce(nominations_table.c.reactions, 0)
-                    + func.coalesce(sub_votes.c.vote_sum, 0)
-                ).label("score"),
-                appearance_count_expr.label("appearance_count"),
-            )
-            .select_from(Book)
-            .outerjoin(nominations_table, nominations_table.c.book_id == Book.id)
-            .outerjoin(sub_votes, sub_votes.c.book_id == Book.id)
-            .outerjoin(appearance_totals, appearance_totals.c.book_id == Book.id)
-            .where(~Book.id.in_(winner_subq))
+        await session.commit()
+
+    async def get_top_noms(self, session, limit: int = 0) -> list[BallotNominee]:
+        max_appearances = _MAX_APPEARANCES
+        stmt = _top_noms_stmt(
+            require_reactions=not _IS_STAGING,
+            max_appearances=max_appearances,
         )
-        if not settings.is_staging:
-            stmt = stmt.where(func.coalesce(nominations_table.c.reactions, 0) > 0)
-        stmt = stmt.where(appearance_count_expr < max_appearances)
+        if limit > 0:
+            stmt = stmt.limit(limit)
         result = await session.execute(stmt)
         rows = result.all()
         if not rows:
             return []
         candidates: list[BallotNominee] = []
         for row in rows:
-            book_id = int(row.book_id)
-            prior_appearances = int(getattr(row, "appearance_count", 0) or 0)
-            if prior_appearances >= max_appearances:
-                continue
+            # book_id/reactions/appearance_count are integer columns already;
+            # only the Numeric-backed sums need conversion from Decimal. The
+            # appearance cap is enforced in the statement's WHERE clause.
+            prior_appearances = row.appearance_count or 0
             vote_sum = float(row.vote_sum) if row.vote_sum is not None else 0.0
             score = float(row.score) if row.score is not None else 0.0
-            created_at = getattr(row, "created_at", None)
+            created_at = row.created_at
             if created_at is None:
                 created_at = datetime.fromtimestamp(0, tz=timezone.utc)
             candidates.append(
                 BallotNominee(
-                    book_id=book_id,
-                    reactions=int(row.reactions),
+                    book_id=row.book_id,
+                    reactions=row.reactions,
                     vote_sum=vote_sum,
                     score=score,
                     prior_appearances=prior_appearances,
                     created_at=created_at,
+                    title=row.title,
+                    summary=row.summary,
+                    message_id=row.message_id,
                 )
             )
-        max_score = max(c.score for c in candidates)
-        ordered_entries = [
-            nominee
-            for nominee in sorted(
-                candidates,
-                key=lambda item: (
-                    item.score != max_score,
-                    item.prior_appearances > 0,
-                    -item.score,
-                    item.created_at.timestamp(),
-                ),
-            )
-        ]
-        if limit > 0:
-            ordered_entries = ordered_entries[:limit]
-        return ordered_entries
+        return candidates
 
     @app_commands.command(
         name="open_voting",
@@ -257,7 +370,7 @@ class VotingSession(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         now = utcnow()
         async with async_session() as session:
-            if await get_open_election(session):
+            if await open_election_exists(session):
                 await interaction.followup.send(
                     "An election is already open.", ephemeral=True
                 )
@@ -270,7 +383,7 @@ class VotingSession(commands.Cog):
                     "No nominations available for voting.", ephemeral=True
                 )
                 return
-            max_appearances = settings.max_election_appearances
+            max_appearances = _MAX_APPEARANCES
             star_threshold = max_appearances - 1 if max_appearances > 0 else None
             last_appearance_ids = {
                 nominee.book_id
@@ -279,22 +392,55 @@ class VotingSession(commands.Cog):
                 and nominee.prior_appearances == star_threshold
             }
             closes_at = now + timedelta(hours=hours)
-            election = Election(
-                opener_discord_id=interaction.user.id,
-                opened_at=now,
-                closes_at=closes_at,
-                ballot=ballot_ids,
+            # RETURNING hands back the new id with the INSERT itself, saving
+            # the refresh round trip.
+            result = await session.execute(
+                insert(Election)
+                .values(
+                    opener_discord_id=interaction.user.id,
+                    opened_at=now,
+                    closes_at=closes_at,
+                    ballot=ballot_ids,
+                )
+                .returning(Election.id)
+            )
+            election_id = result.scalar_one()
+            # Mirror the JSON ballot into the normalized entry table that
+            # backs the appearance-count index.
+            await session.execute(
+                insert(ElectionBallotEntry),
+                [
+                    {"election_id": election_id, "position": idx, "book_id": bid}
+                    for idx, bid in enumerate(ballot_ids)
+                ],
             )
-            session.add(election)
             await session.commit()
-            await session.refresh(election)
-        await self._election_embed(
-            interaction,
-            election.id,
-            ballot_ids,
-            closes_at,
-            last_appearance_ids,
-        )
+            # The ranking query already carried the render columns, so the
+            # embed entries come straight from the ballot with no further
+            # queries; the session is still passed for the message-id write.
+            guild_id = self._resolve_guild_id(interaction)
+            entries = [
+                BallotEntryDetails(
+                    book_id=nominee.book_id,
+                    title=nominee.title,
+                    summary=nominee.summary,
+                    jump_url=(
+                        nomination_message_url(nominee.message_id, guild_id)
+                        if nominee.message_id is not None
+                        else None
+                    ),
+                )
+                for nominee in ballot
+            ]
+            await self._election_embed(
+                interaction,
+                election_id,
+                ballot_ids,
+                closes_at,
+                last_appearance_ids,
+                session=session,
+                entries=entries,
+            )
 
     async def _election_embed(
         self,
@@ -303,40 +449,61 @@ class VotingSession(commands.Cog):
         ballot: list[int],
         closes_at: datetime,
         last_appearance_ids: Optional[set[int]] = None,
+        *,
+        session=None,
+        entries: Optional[list[BallotEntryDetails]] = None,
     ):
         embed = discord.Embed(
             title="Book Club Election",
             description=self._build_election_description(closes_at),
         )
-        async with async_session() as session:
-            guild_id = self._resolve_guild_id(interaction)
-            entries = await self._get_ballot_entries(session, ballot, guild_id)
-            for idx, entry in enumerate(entries, start=1):
-                book = entry.book
-                title = short_book_title(book.title)
-                if last_appearance_ids and book.id in last_appearance_ids:
-                    title += " *"
-                field_name = (
-                    f"{idx}. {title} {entry.jump_url}"
-                    if entry.jump_url is not None
-                    else f"{idx}. {title}"
-                )
-                summary = book.summary or "No summary available."
-                if len(summary) > 1024:
-                    summary = summary[:1021] + "..."
-                embed.add_field(name=field_name, value=summary, inline=False)
-        channel = interaction.client.get_channel(settings.bookclub_channel_id)
-        if channel is None:
-            channel = await interaction.client.fetch_channel(
-                settings.bookclub_channel_id
+        guild_id = self._resolve_guild_id(interaction)
+
+        async def _load_entries():
+            if entries is not None:
+                return entries
+            if session is not None:
+                return await self._get_ballot_entries(session, ballot, guild_id)
+            async with async_session() as fresh_session:
+                return await self._get_ballot_entries(fresh_session, ballot, guild_id)
+
+        # Channel resolution can hit the REST API on a cold cache; overlap it
+        # with the ballot-entry query instead of waiting for one then the
+        # other.
+        loaded_entries, channel = await asyncio.gather(
+            _load_entries(), self._get_bookclub_channel(interaction.client)
+        )
+        for idx, entry in enumerate(loaded_entries, start=1):
+            title = short_book_title(entry.title)
+            if last_appearance_ids and entry.book_id in last_appearance_ids:
+                title += " *"
+            field_name = (
+                f"{idx}. {title} {entry.jump_url}"
+                if entry.jump_url is not None
+                else f"{idx}. {title}"
             )
+            summary = entry.summary or "No summary available."
+            if len(summary) > 1024:
+                summary = summary[:1021] + "..."
+            embed.add_field(name=field_name, value=summary, inline=False)
         message = await channel.send(embed=embed)
-        async with async_session() as session:
-            election = await session.get(Election, election_id)
-            if election:
-                election.ballot_message_id = message.id
-                session.add(election)
-                await session.commit()
+
+        async def _store_message_id(active_session):
+            # Direct UPDATE: no need to SELECT the row just to set one
+            # column, and nothing in the session needs synchronizing.
+            await active_session.execute(
+                update(Election)
+                .where(Election.id == election_id)
+                .values(ballot_message_id=message.id)
+                .execution_options(synchronize_session=False)
+            )
+            await active_session.commit()
+
+        if session is not None:
+            await _store_message_id(session)
+        else:
+            async with async_session() as fresh_session:
+                await _store_message_id(fresh_session)
         try:
             await update_election_vote_reaction(interaction.client, election_id)
         except Exception:
@@ -352,9 +519,7 @@ class VotingSession(commands.Cog):
         ballot_message_id: int,
         closes_at: datetime,
     ) -> None:
-        channel = client.get_channel(settings.bookclub_channel_id)
-        if channel is None:
-            channel = await client.fetch_channel(settings.bookclub_channel_id)
+        channel = await self._get_bookclub_channel(client)
         try:
             message = await channel.fetch_message(ballot_message_id)
         except DiscordNotFound:
@@ -469,24 +634,42 @@ class VotingSession(commands.Cog):
                     "The open election has no ballot.", ephemeral=True
                 )
                 return
-            totals_rows = await get_election_vote_totals(session, election.id)
-            totals = {book.id: votes for book, votes in totals_rows}
-            books_result = await session.execute(
-                select(Book).where(Book.id.in_(ballot_ids))
-            )
-            books = {book.id: book for book in books_result.scalars().all()}
 
-        summaries: list[VoteSummary] = []
+        # The totals aggregate and the book lookup are independent once the
+        # election is known; overlap them on separate sessions, since a
+        # single AsyncSession cannot run queries concurrently.
+        async def _load_totals():
+            async with async_session() as totals_session:
+                return await get_election_vote_totals(totals_session, election.id)
+
+        async def _load_books():
+            async with async_session() as books_session:
+                result = await books_session.execute(
+                    _BALLOT_BOOKS_STMT, {"ballot_ids": ballot_ids}
+                )
+                return result.all()
+
+        totals_rows, ballot_books = await asyncio.gather(_load_totals(), _load_books())
+        books = {row.id: row for row in ballot_books}
+
+        # totals_rows arrive pre-sorted (the statement orders by summed
+        # weight descending), so voted books stream straight into place;
+        # zero-vote ballot books trail in ballot order.
+        ballot_id_set = set(ballot_ids)
+        voted_ids = {book.id for book, _ in totals_rows}
+        summaries = [
+            f"{short_book_title(book.title)}: {format_vote_count(total)}"
+            for book, total in totals_rows
+            if book.id in ballot_id_set
+        ]
         for book_id in ballot_ids:
+            if book_id in voted_ids:
+                continue
             book = books.get(book_id)
             if not book:
                 continue
-            total = totals.get(book_id, 0.0)
             summaries.append(
-                VoteSummary(
-                    total_votes=total,
-                    text=f"{short_book_title(book.title)}: {format_vote_count(total)}",
-                )
+                f"{short_book_title(book.title)}: {format_vote_count(0.0)}"
             )
 
         if not summaries:
@@ -495,9 +678,7 @@ class VotingSession(commands.Cog):
             )
             return
 
-        summaries.sort(key=lambda item: item.total_votes, reverse=True)
-        content = "\n".join(item.text for item in summaries)
-        await interaction.followup.send(content, ephemeral=True)
+        await interaction.followup.send("\n".join(summaries), ephemeral=True)
 
     @app_commands.command(
         name="ballot_preview",
@@ -507,7 +688,7 @@ class VotingSession(commands.Cog):
     async def ballot_preview(self, interaction: discord.Interaction, limit: int = 5):
         await interaction.response.defer(ephemeral=True)
         async with async_session() as session:
-            if await get_open_election(session):
+            if await open_election_exists(session):
                 await interaction.followup.send(
                     "An election is currently open. Cannot preview ballot.",
                     ephemeral=True,
@@ -520,11 +701,8 @@ class VotingSession(commands.Cog):
                 )
                 return
             embed = discord.Embed(title="Upcoming Ballot Preview")
-            book_ids = [nominee.book_id for nominee in ballot]
             guild_id = self._resolve_guild_id(interaction)
-            entries = await self._get_ballot_entries(session, book_ids, guild_id)
-            entry_lookup = {entry.book.id: entry for entry in entries}
-            max_appearances = settings.max_election_appearances
+            max_appearances = _MAX_APPEARANCES
             star_threshold = max_appearances - 1 if max_appearances > 0 else None
 
             def _format_score(value: float) -> str:
@@ -532,13 +710,15 @@ class VotingSession(commands.Cog):
                 trimmed = text.rstrip("0").rstrip(".")
                 return trimmed or "0"
 
+            # The ranking query already carried title and message id, so the
+            # preview renders without a second lookup.
             for idx, nominee in enumerate(ballot, start=1):
-                entry = entry_lookup.get(nominee.book_id)
-                if entry is None:
-                    continue
-                book = entry.book
-                jump_url = entry.jump_url
-                title = short_book_title(book.title)
+                jump_url = (
+                    nomination_message_url(nominee.message_id, guild_id)
+                    if nominee.message_id is not None
+                    else None
+                )
+                title = short_book_title(nominee.title)
                 if (
                     star_threshold is not None
                     and nominee.prior_appearances == star_threshold
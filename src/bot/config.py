@@ -13,6 +13,7 @@ class Settings(BaseSettings):
     weight_inner: int = Field(alias="VOTE_WEIGHT_INNER")
     weight_outer: int = Field(alias="VOTE_WEIGHT_OUTER")
     database_url: str = Field(alias="DATABASE_URL")
+    database_pool_size: int = Field(default=20, alias="DATABASE_POOL_SIZE")
     redis_url: str = Field(alias="REDIS_URL")
     openai_api_key: str = Field(alias="OPENAI_API_KEY")
     openai_book_lookup_model: str = Field(
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     AsyncSession,
 )
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy import (
     Integer,
@@ -23,11 +24,34 @@ from sqlalchemy import (
 from datetime import datetime
 from bot.config import get_settings
 
+# asyncpg caches prepared statements per connection, letting repeated
+# point-lookups skip parse/plan. Set to 0 if pgbouncer ever fronts the DB.
+ASYNCPG_STATEMENT_CACHE_SIZE = 500
+
 
 @lru_cache
 def get_engine():
     settings = get_settings()
-    return create_async_engine(settings.database_url, echo=False, future=True)
+    connect_args = {}
+    engine_kwargs = {}
+    if make_url(settings.database_url).get_driver_name() == "asyncpg":
+        connect_args["statement_cache_size"] = ASYNCPG_STATEMENT_CACHE_SIZE
+        # LIFO checkout keeps reusing the same hot connections, so their
+        # prepared-statement caches stay warm; recycle guards against the
+        # server closing idle connections underneath us.
+        engine_kwargs.update(
+            pool_size=settings.database_pool_size,
+            max_overflow=0,
+            pool_use_lifo=True,
+            pool_recycle=1800,
+        )
+    return create_async_engine(
+        settings.database_url,
+        echo=False,
+        future=True,
+        connect_args=connect_args,
+        **engine_kwargs,
+    )
 
 
 @lru_cache
@@ -90,6 +114,18 @@ class Election(Base):
     )
 
 
+class ElectionBallotEntry(Base):
+    """Normalized mirror of Election.ballot for indexable appearance counts."""
+
+    __tablename__ = "election_ballot_entries"
+
+    election_id: Mapped[int] = mapped_column(
+        ForeignKey("elections.id", ondelete="CASCADE"), primary_key=True
+    )
+    position: Mapped[int] = mapped_column(Integer, primary_key=True)
+    book_id: Mapped[int] = mapped_column(ForeignKey("books.id", ondelete="CASCADE"))
+
+
 class Vote(Base):
     __tablename__ = "votes"
 
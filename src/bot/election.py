@@ -1,5 +1,5 @@
 import discord
-from sqlalchemy import update, select, func
+from sqlalchemy import bindparam, update, select, func
 
 
 from bot.config import get_settings
@@ -8,15 +8,19 @@ from bot.utils import format_vote_count, utcnow
 
 settings = get_settings()
 
+# Built once at import time; the election id is supplied per call via a bind
+# parameter so every execution hits the same compiled-SQL cache entry.
+_VOTE_TOTALS_STMT = (
+    select(Book, func.sum(Vote.weight).label("total_votes"))
+    .join(Vote, Book.id == Vote.book_id)
+    .where(Vote.election_id == bindparam("election_id"))
+    .group_by(Book)
+    .order_by(func.sum(Vote.weight).desc())
+)
+
 
 async def get_election_vote_totals(session, election_id):
-    result = await session.execute(
-        select(Book, func.sum(Vote.weight).label("total_votes"))
-        .join(Vote, Book.id == Vote.book_id)
-        .where(Vote.election_id == election_id)
-        .group_by(Book)
-        .order_by(func.sum(Vote.weight).desc())
-    )
+    result = await session.execute(_VOTE_TOTALS_STMT, {"election_id": election_id})
     return [(book, float(total or 0.0)) for book, total in result.all()]
 
 
@@ -34,7 +38,9 @@ async def close_and_tally(client, session, election, closed_by=None):
     winner, _ = all_votes[0] if all_votes else (None, 0)
     if winner:
         election.winner = winner.id
-        await session.commit()
+    # Commit the close and the winner together before announcing, so the
+    # result is persisted in one round trip even if the Discord send fails.
+    await session.commit()
 
     embed = discord.Embed(title="Election Results", description="Voting has ended.")
     embed.add_field(
@@ -47,5 +53,4 @@ async def close_and_tally(client, session, election, closed_by=None):
             inline=False,
         )
     await client.get_channel(settings.bookclub_channel_id).send(embed=embed)
-    await session.commit()
     return winner
@@ -1,7 +1,7 @@
 import asyncio
 from contextlib import suppress
 from datetime import datetime, timezone
-from functools import wraps
+from functools import lru_cache, wraps
 from math import isclose, isfinite
 from string import capwords
 from typing import Any, Awaitable, Callable, Optional, TypeVar
@@ -20,6 +20,15 @@ NOMINATION_CANCEL_EMOJI = "❌"
 settings = get_settings()
 MOUNTAIN = ZoneInfo("America/Denver")
 
+# Built once at import time so repeated calls reuse the same statement tree
+# (and its compiled-SQL cache entry) instead of rebuilding it per call.
+_OPEN_ELECTION_STMT = (
+    select(Election)
+    .where(Election.closed_at.is_(None))
+    .order_by(Election.opened_at.desc())
+    .limit(1)
+)
+
 
 def utcnow() -> datetime:
     """
@@ -28,18 +37,30 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+_OPEN_ELECTION_EXISTS_STMT = select(
+    select(Election.id).where(Election.closed_at.is_(None)).exists()
+)
+
+
 async def get_open_election(session):
-    return (
-        await session.execute(
-            select(Election)
-            .where(Election.closed_at.is_(None))
-            .order_by(Election.opened_at.desc())
-        )
-    ).scalar_one_or_none()
+    return (await session.execute(_OPEN_ELECTION_STMT)).scalar_one_or_none()
+
 
+async def open_election_exists(session) -> bool:
+    """Cheap existence probe for callers that only need a yes/no answer."""
 
+    return bool(
+        (await session.execute(_OPEN_ELECTION_EXISTS_STMT)).scalar_one_or_none()
+    )
+
+
+@lru_cache(maxsize=256)
 def short_book_title(title: str) -> str:
-    """Return a colon-truncated, capitalized version of a book title."""
+    """Return a colon-truncated, capitalized version of a book title.
+
+    Pure string-to-string, so repeat renders of the same title across
+    ballots, previews, and modals hit the cache instead of re-splitting.
+    """
 
     head, *_ = title.split(":", 1)
     shortened = head.strip() or title.strip()
@@ -77,6 +77,7 @@ def test_send_prediction_reminders_marks_and_notifies(monkeypatch):
         now = datetime(2024, 1, 1, tzinfo=timezone.utc)
         local_due = now.astimezone(ZoneInfo("America/Denver")).replace(tzinfo=None)
         prediction = SimpleNamespace(
+            id=1,
             text="Read more sci-fi",
             reminded=False,
             message_id=17,
@@ -102,7 +103,7 @@ def test_send_prediction_reminders_marks_and_notifies(monkeypatch):
 
         await background_mod.send_prediction_reminders(client)
 
-        assert prediction.reminded is True
+        assert session.execute.await_count == 2  # select + bulk reminded update
         message = channel.send.await_args.args[0]
         assert "Reminder to adjudicate prediction" in message
         assert "> Read more sci-fi" in message
@@ -135,7 +136,7 @@ def test_send_prediction_reminders_fetches_channel_when_missing(monkeypatch):
     async def _run():
         now = datetime(2024, 1, 1, tzinfo=timezone.utc)
         prediction = SimpleNamespace(
-            text="Reminder", reminded=False, message_id=None, due_at=now
+            id=2, text="Reminder", reminded=False, message_id=None, due_at=now
         )
         session = SimpleNamespace()
         session.execute = AsyncMock(return_value=_FakeScalarResult([prediction]))
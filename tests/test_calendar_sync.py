@@ -20,12 +20,10 @@ class _Resp:
 class _Client:
     def __init__(self, routes):
         self.routes = routes
+        self.closed = False
 
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc, tb):
-        return False
+    def close(self):
+        self.closed = True
 
     def get(self, url, headers=None, params=None):
         key = ("GET", url, frozenset((params or {}).items()))
@@ -64,27 +62,21 @@ def test_run_staging_is_dry_run(monkeypatch):
     monkeypatch.setattr(sync, "_load_google_events", lambda: [{}])
     monkeypatch.setattr(sync, "_build_sync_plan", lambda *_: plan)
 
-    called = []
-    monkeypatch.setattr(
-        sync, "_create_google_event", lambda *_: called.append("create")
-    )
-    monkeypatch.setattr(
-        sync, "_update_google_event", lambda *_: called.append("update")
-    )
+    batches = []
     monkeypatch.setattr(
-        sync, "_cancel_google_event", lambda *_: called.append("cancel")
+        sync, "_execute_calendar_batch", lambda parts: batches.append(parts) or []
     )
 
     summary = sync.run()
     assert summary["mode"] == "dry-run"
-    assert called == []
+    assert batches == []
 
 
-def test_run_apply_calls_create_update_cancel(monkeypatch):
+def test_run_apply_batches_create_update_cancel(monkeypatch):
     sync = DiscordGoogleCalendarSync(_settings(is_staging=False))
     plan = SyncPlan(
         to_create=[{"a": 1}],
-        to_update=[{"google_event_id": "x", "body": {}}],
+        to_update=[{"google_event_id": "x", "body": {"b": 2}}],
         to_cancel=[{"google_event_id": "y"}],
     )
 
@@ -92,20 +84,53 @@ def test_run_apply_calls_create_update_cancel(monkeypatch):
     monkeypatch.setattr(sync, "_load_google_events", lambda: [{}])
     monkeypatch.setattr(sync, "_build_sync_plan", lambda *_: plan)
 
-    called = []
-    monkeypatch.setattr(
-        sync, "_create_google_event", lambda *_: called.append("create")
-    )
-    monkeypatch.setattr(
-        sync, "_update_google_event", lambda *_: called.append("update")
-    )
+    batches = []
     monkeypatch.setattr(
-        sync, "_cancel_google_event", lambda *_: called.append("cancel")
+        sync, "_execute_calendar_batch", lambda parts: batches.append(parts) or []
     )
 
     summary = sync.run()
     assert summary["mode"] == "apply"
-    assert called == ["create", "update", "cancel"]
+    assert len(batches) == 1
+    assert batches[0] == [
+        ("POST", "/calendar/v3/calendars/cal/events", {"a": 1}),
+        ("PATCH", "/calendar/v3/calendars/cal/events/x", {"b": 2}),
+        ("PATCH", "/calendar/v3/calendars/cal/events/y", {"status": "cancelled"}),
+    ]
+
+
+def test_apply_sync_plan_splits_oversized_batches(monkeypatch):
+    sync = DiscordGoogleCalendarSync(_settings())
+    plan = SyncPlan(to_create=[{"n": i} for i in range(75)])
+
+    batches = []
+    monkeypatch.setattr(
+        sync, "_execute_calendar_batch", lambda parts: batches.append(parts) or []
+    )
+
+    assert sync._apply_sync_plan(plan) == []
+    assert [len(batch) for batch in batches] == [50, 25]
+
+
+def test_encode_calendar_batch_and_part_errors():
+    payload = DiscordGoogleCalendarSync._encode_calendar_batch(
+        [("POST", "/calendar/v3/calendars/cal/events", {"a": 1})],
+        "batch_x",
+    )
+    assert b"--batch_x\r\n" in payload
+    assert b"POST /calendar/v3/calendars/cal/events HTTP/1.1" in payload
+    assert payload.endswith(b"--batch_x--\r\n")
+
+    response_text = (
+        "--batch_x\r\nContent-Type: application/http\r\n\r\n"
+        "HTTP/1.1 200 OK\r\n\r\n{}\r\n"
+        "--batch_x\r\nContent-Type: application/http\r\n\r\n"
+        "HTTP/1.1 403 Forbidden\r\n\r\n{}\r\n"
+        "--batch_x--\r\n"
+    )
+    assert DiscordGoogleCalendarSync._batch_part_errors(response_text) == [
+        "403 Forbidden"
+    ]
 
 
 def test_load_discord_events(monkeypatch):
@@ -122,26 +147,25 @@ def test_load_discord_events(monkeypatch):
     assert events == [{"id": "1"}]
 
 
+_LIST_FIELDS = (
+    "nextPageToken,nextSyncToken,"
+    "items(id,status,start/dateTime,extendedProperties/private)"
+)
+_BASE_LIST_PARAMS = {
+    ("singleEvents", "true"),
+    ("showDeleted", "true"),
+    ("maxResults", 2500),
+    ("fields", _LIST_FIELDS),
+}
+
+
 def test_load_google_events_filters_and_paginates(monkeypatch):
     sync = DiscordGoogleCalendarSync(_settings(google_calendar_id="abc"))
     url = "https://www.googleapis.com/calendar/v3/calendars/abc/events"
-    params1 = frozenset(
-        {
-            ("singleEvents", "true"),
-            ("showDeleted", "false"),
-            ("maxResults", 2500),
-            ("timeMin", "2026-01-01T00:00:00Z"),
-        }
-    )
-    params2 = frozenset(
-        {
-            ("singleEvents", "true"),
-            ("showDeleted", "false"),
-            ("maxResults", 2500),
-            ("timeMin", "2026-01-01T00:00:00Z"),
-            ("pageToken", "next"),
-        }
-    )
+    # The unfiltered listing is what makes the API include nextSyncToken;
+    # filtered listings (timeMin et al.) never carry one.
+    params1 = frozenset(_BASE_LIST_PARAMS)
+    params2 = frozenset(_BASE_LIST_PARAMS | {("pageToken", "next")})
     routes = {
         ("GET", url, params1): [
             _Resp(
@@ -149,6 +173,7 @@ def test_load_google_events_filters_and_paginates(monkeypatch):
                     "items": [
                         {
                             "id": "keep-1",
+                            "start": {"dateTime": "2026-02-01T00:00:00Z"},
                             "extendedProperties": {
                                 "private": {
                                     "sync_source": "discord_scheduled_event",
@@ -157,6 +182,16 @@ def test_load_google_events_filters_and_paginates(monkeypatch):
                             },
                         },
                         {"id": "drop-1", "extendedProperties": {"private": {}}},
+                        {
+                            "id": "drop-old",
+                            "start": {"dateTime": "2025-12-01T00:00:00Z"},
+                            "extendedProperties": {
+                                "private": {
+                                    "sync_source": "discord_scheduled_event",
+                                    "discord_event_id": "d0",
+                                }
+                            },
+                        },
                     ],
                     "nextPageToken": "next",
                 }
@@ -175,18 +210,78 @@ def test_load_google_events_filters_and_paginates(monkeypatch):
                                 }
                             },
                         }
-                    ]
+                    ],
+                    "nextSyncToken": "tok-1",
                 }
             )
         ],
     }
+    monkeypatch.setattr("bot.calendar_sync._SYNC_STATE", {})
     monkeypatch.setattr(
         "bot.calendar_sync.httpx.Client", lambda timeout: _Client(routes)
     )
     monkeypatch.setattr(sync, "_google_headers", lambda: {"Authorization": "Bearer x"})
 
     events = sync._load_google_events()
-    assert [e["id"] for e in events] == ["keep-1", "keep-2"]
+    assert sorted(e["id"] for e in events) == ["keep-1", "keep-2"]
+
+    import bot.calendar_sync as calendar_sync
+
+    token, mirror = calendar_sync._SYNC_STATE["abc"]
+    assert token == "tok-1"
+    assert set(mirror) == {"keep-1", "keep-2"}
+
+
+def test_load_google_events_incremental_patches_mirror(monkeypatch):
+    sync = DiscordGoogleCalendarSync(_settings(google_calendar_id="abc"))
+    url = "https://www.googleapis.com/calendar/v3/calendars/abc/events"
+    existing = {
+        "id": "keep-1",
+        "extendedProperties": {
+            "private": {
+                "sync_source": "discord_scheduled_event",
+                "discord_event_id": "d1",
+            }
+        },
+    }
+    params = frozenset(_BASE_LIST_PARAMS | {("syncToken", "tok-1")})
+    routes = {
+        ("GET", url, params): [
+            _Resp(
+                {
+                    "items": [
+                        {"id": "keep-1", "status": "cancelled"},
+                        {
+                            "id": "keep-3",
+                            "extendedProperties": {
+                                "private": {
+                                    "sync_source": "discord_scheduled_event",
+                                    "discord_event_id": "d3",
+                                }
+                            },
+                        },
+                    ],
+                    "nextSyncToken": "tok-2",
+                }
+            )
+        ]
+    }
+    monkeypatch.setattr(
+        "bot.calendar_sync._SYNC_STATE", {"abc": ("tok-1", {"keep-1": existing})}
+    )
+    monkeypatch.setattr(
+        "bot.calendar_sync.httpx.Client", lambda timeout: _Client(routes)
+    )
+    monkeypatch.setattr(sync, "_google_headers", lambda: {"Authorization": "Bearer x"})
+
+    events = sync._load_google_events()
+    assert [e["id"] for e in events] == ["keep-3"]
+
+    import bot.calendar_sync as calendar_sync
+
+    token, mirror = calendar_sync._SYNC_STATE["abc"]
+    assert token == "tok-2"
+    assert set(mirror) == {"keep-3"}
 
 
 def test_build_google_event_body_and_cutoff():
@@ -131,6 +131,49 @@ async def test_nominate_matching_book_without_nomination_reuses_book(monkeypatch
     assert session.commit_calls == 1
 
 
+@pytest.mark.asyncio
+async def test_nominate_commits_even_if_reaction_fails(monkeypatch):
+    existing_book = SimpleNamespace(
+        id=42,
+        title="Existing",
+        summary="Existing summary",
+        length=111,
+    )
+    session = DummySession(
+        execute_results=[
+            DummyResult(scalar=existing_book),
+            DummyResult(scalar=None),
+        ]
+    )
+    monkeypatch.setattr(
+        "bot.commands.nominate.async_session", lambda: session_cm(session)
+    )
+
+    cog = Nominate(bot=SimpleNamespace())
+    monkeypatch.setattr(cog, "lookup_book", AsyncMock(return_value=lookup_result()))
+
+    class FailingReactionChannel(DummyChannel):
+        async def send(self, content=None, embed=None):
+            message = await super().send(content=content, embed=embed)
+            message.add_reaction = AsyncMock(side_effect=RuntimeError("no perms"))
+            return message
+
+    nom_channel = FailingReactionChannel(2)
+    interaction = DummyInteraction(
+        user_id=99,
+        client=SimpleNamespace(get_channel=lambda _cid: nom_channel),
+    )
+
+    await cog.nominate(interaction, "978-0-395-19395-2")
+
+    # The commit must settle before the session context exits, and the
+    # reaction failure still surfaces to the user afterwards.
+    assert session.commit_calls == 1
+    assert interaction.followup.messages[-1]["content"].startswith(
+        "Something went wrong"
+    )
+
+
 @pytest.mark.asyncio
 async def test_nominate_creates_book_and_posts_embed(monkeypatch):
     fixed_now = utcnow()
@@ -660,6 +703,49 @@ async def test_lookup_book_uses_openai_structured_output(monkeypatch):
     assert kwargs["max_output_tokens"] == settings.openai_book_lookup_max_output_tokens
 
 
+@pytest.mark.asyncio
+async def test_lookup_book_caches_repeat_queries(monkeypatch):
+    parsed = lookup_result(title="Common Sense", subtitle=None)
+    parse_mock = AsyncMock(return_value=SimpleNamespace(output_parsed=parsed))
+
+    class DummyOpenAI:
+        def __init__(self, *, api_key):
+            self.responses = SimpleNamespace(parse=parse_mock)
+
+    monkeypatch.setattr("bot.commands.nominate.AsyncOpenAI", DummyOpenAI)
+    cog = Nominate(bot=SimpleNamespace())
+
+    first = await cog.lookup_book("Common Sense")
+    second = await cog.lookup_book("  common   SENSE ")
+
+    assert first is parsed
+    assert second is parsed
+    parse_mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_lookup_book_does_not_cache_failures(monkeypatch):
+    parsed = lookup_result(title="Common Sense", subtitle=None)
+    parse_mock = AsyncMock(
+        side_effect=[
+            SimpleNamespace(output_parsed=None),
+            SimpleNamespace(output_parsed=parsed),
+        ]
+    )
+
+    class DummyOpenAI:
+        def __init__(self, *, api_key):
+            self.responses = SimpleNamespace(parse=parse_mock)
+
+    monkeypatch.setattr("bot.commands.nominate.AsyncOpenAI", DummyOpenAI)
+    cog = Nominate(bot=SimpleNamespace())
+
+    with pytest.raises(BookLookupError):
+        await cog.lookup_book("Common Sense")
+
+    assert await cog.lookup_book("Common Sense") is parsed
+
+
 @pytest.mark.asyncio
 async def test_lookup_book_rejects_invalid_structured_output(monkeypatch):
     parse_mock = AsyncMock(return_value=SimpleNamespace(output_parsed=None))
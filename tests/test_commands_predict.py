@@ -7,13 +7,18 @@ from zoneinfo import ZoneInfo
 import pytest
 
 from bot.commands.predict import Predict
-from bot.db import Prediction
-from tests.utils import DummyChannel, DummyInteraction, DummySession, session_cm
+from tests.utils import (
+    DummyChannel,
+    DummyInteraction,
+    DummyResult,
+    DummySession,
+    session_cm,
+)
 
 
 @pytest.mark.asyncio
 async def test_predict_records_prediction(monkeypatch):
-    session = DummySession()
+    session = DummySession(execute_results=[DummyResult()])
     monkeypatch.setattr(
         "bot.commands.predict.async_session", lambda: session_cm(session)
     )
@@ -31,19 +36,45 @@ async def test_predict_records_prediction(monkeypatch):
     )
 
     assert len(channel.messages) == 1
-    record = session.added[0]
-    assert isinstance(record, Prediction)
-    assert record.text == "We read more sci-fi"
-    assert float(record.odds) == pytest.approx(60.0)
-    assert record.due_at == datetime(2024, 1, 10, 0, 0)
+    params = session.executed[0].compile().params
+    assert params["predictor_discord_id"] == interaction.user.id
+    assert params["text"] == "We read more sci-fi"
+    assert float(params["odds"]) == pytest.approx(60.0)
+    assert params["due_at"] == datetime(2024, 1, 10, 0, 0)
     assert session.commit_calls == 1
     response = interaction.response.messages[0]
     assert response["ephemeral"] is True
 
 
+@pytest.mark.asyncio
+async def test_predict_commits_even_if_mirror_send_fails(monkeypatch):
+    session = DummySession(execute_results=[DummyResult()])
+    monkeypatch.setattr(
+        "bot.commands.predict.async_session", lambda: session_cm(session)
+    )
+    channel = DummyChannel(5, guild_id=42)
+    bot = SimpleNamespace(get_channel=lambda _cid: channel, fetch_channel=AsyncMock())
+    interaction = DummyInteraction()
+    interaction.channel.send = AsyncMock(side_effect=RuntimeError("no perms"))
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    monkeypatch.setattr("bot.utils.utcnow", lambda: base)
+    monkeypatch.setattr("bot.commands.predict.utcnow", lambda: base)
+
+    cog = Predict(bot)
+
+    await cog.predict(interaction, due="2024-01-10", text="Risky claim", probability=30)
+
+    # The commit must settle before the session context exits, and the
+    # mirror failure still surfaces to the user afterwards.
+    assert session.commit_calls == 1
+    assert interaction.response.messages[0]["content"].startswith(
+        "Something went wrong"
+    )
+
+
 @pytest.mark.asyncio
 async def test_predict_accepts_percentage(monkeypatch):
-    session = DummySession()
+    session = DummySession(execute_results=[DummyResult()])
     monkeypatch.setattr(
         "bot.commands.predict.async_session", lambda: session_cm(session)
     )
@@ -58,13 +89,13 @@ async def test_predict_accepts_percentage(monkeypatch):
 
     await cog.predict(interaction, due="2024-01-10", text="It rains", probability=75)
 
-    record = session.added[0]
-    assert float(record.odds) == pytest.approx(75.0)
+    params = session.executed[0].compile().params
+    assert float(params["odds"]) == pytest.approx(75.0)
 
 
 @pytest.mark.asyncio
 async def test_predict_accepts_datetime_input(monkeypatch):
-    session = DummySession()
+    session = DummySession(execute_results=[DummyResult()])
     monkeypatch.setattr(
         "bot.commands.predict.async_session", lambda: session_cm(session)
     )
@@ -84,14 +115,14 @@ async def test_predict_accepts_datetime_input(monkeypatch):
         probability=50,
     )
 
-    record = session.added[0]
-    assert record.due_at == datetime(2024, 1, 10, 13, 30)
-    assert float(record.odds) == pytest.approx(50.0)
+    params = session.executed[0].compile().params
+    assert params["due_at"] == datetime(2024, 1, 10, 13, 30)
+    assert float(params["odds"]) == pytest.approx(50.0)
 
 
 @pytest.mark.asyncio
 async def test_predict_accepts_relative_minutes(monkeypatch):
-    session = DummySession()
+    session = DummySession(execute_results=[DummyResult()])
     monkeypatch.setattr(
         "bot.commands.predict.async_session", lambda: session_cm(session)
     )
@@ -113,9 +144,9 @@ async def test_predict_accepts_relative_minutes(monkeypatch):
     )
 
     expected_local = base.astimezone(ZoneInfo("America/Denver")) + timedelta(minutes=2)
-    record = session.added[0]
-    assert record.due_at == expected_local.replace(tzinfo=None)
-    assert float(record.odds) == pytest.approx(40.0)
+    params = session.executed[0].compile().params
+    assert params["due_at"] == expected_local.replace(tzinfo=None)
+    assert float(params["odds"]) == pytest.approx(40.0)
 
 
 @pytest.mark.asyncio
@@ -138,7 +169,7 @@ async def test_predict_handles_invalid_date(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_predict_parses_natural_language(monkeypatch):
-    session = DummySession()
+    session = DummySession(execute_results=[DummyResult()])
     monkeypatch.setattr(
         "bot.commands.predict.async_session", lambda: session_cm(session)
     )
@@ -156,12 +187,12 @@ async def test_predict_parses_natural_language(monkeypatch):
         interaction, due="next week", text="We finish the book", probability=80
     )
 
-    record = session.added[0]
+    params = session.executed[0].compile().params
     expected_local = datetime(2024, 1, 1, tzinfo=timezone.utc).astimezone(
         ZoneInfo("America/Denver")
     ) + timedelta(weeks=1)
-    assert record.due_at == expected_local.replace(tzinfo=None)
-    assert float(record.odds) == pytest.approx(80.0)
+    assert params["due_at"] == expected_local.replace(tzinfo=None)
+    assert float(params["odds"]) == pytest.approx(80.0)
 
 
 @pytest.mark.asyncio
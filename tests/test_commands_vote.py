@@ -57,11 +57,7 @@ async def test_record_votes_rejects_excess_total(monkeypatch):
 async def test_record_votes_persists(monkeypatch):
     modal = BallotModal.__new__(BallotModal)
     modal.is_bookclub = True
-    monkeypatch.setattr(
-        "bot.commands.vote.get_open_election",
-        AsyncMock(return_value=SimpleNamespace(id=7)),
-    )
-    session = DummySession(execute_results=[DummyResult(), DummyResult()])
+    session = DummySession(execute_results=[DummyResult(scalars=[7])])
     monkeypatch.setattr("bot.commands.vote.async_session", lambda: session_cm(session))
     update_mock = AsyncMock()
     monkeypatch.setattr("bot.commands.vote.update_election_vote_reaction", update_mock)
@@ -72,7 +68,8 @@ async def test_record_votes_persists(monkeypatch):
         modal, interaction, entries={1: 2.0, 2: 1.0}
     )
 
-    assert len(session.executed) == 2
+    assert election_id == 7
+    assert len(session.executed) == 1
     assert session.commit_calls == 1
     update_mock.assert_awaited_once_with(client, election_id)
 
@@ -166,6 +163,28 @@ async def test_vote_command_opens_modal(monkeypatch):
     assert titles[0] == "Two"
 
 
+@pytest.mark.asyncio
+async def test_load_ballot_caches_within_ttl(monkeypatch):
+    election = SimpleNamespace(ballot=[1])
+    books = [SimpleNamespace(id=1, title="One")]
+    session = DummySession(
+        execute_results=[
+            DummyResult(scalar=election),
+            DummyResult(scalars=books),
+        ]
+    )
+    monkeypatch.setattr("bot.commands.vote.async_session", lambda: session_cm(session))
+    ballot = Ballot(bot=SimpleNamespace())
+
+    first = await ballot._load_ballot()
+    # A second call inside the TTL reuses the cached ballot; the DummySession
+    # would raise if another query were issued.
+    second = await ballot._load_ballot()
+
+    assert first == second
+    assert len(session.executed) == 2
+
+
 @pytest.mark.asyncio
 async def test_on_submit_handles_float_error(monkeypatch):
     modal = BallotModal([SimpleNamespace(id=1, title="A")])
@@ -6,7 +6,6 @@ import pytest
 
 from bot.commands.voting_session import BallotNominee, VotingSession
 from bot.config import get_settings
-from bot.db import Election
 from bot.utils import NOMINATION_CANCEL_EMOJI, UserFacingError
 from tests.utils import (
     DummyChannel,
@@ -31,6 +30,9 @@ async def test_get_top_noms_returns_scores(monkeypatch):
                         reactions=2,
                         vote_sum=1.5,
                         score=3.5,
+                        title="",
+                        summary=None,
+                        message_id=None,
                         appearance_count=0,
                         created_at=created_at,
                     )
@@ -58,6 +60,9 @@ async def test_get_top_noms_uses_stored_reaction_counts(monkeypatch):
                         reactions=4,
                         vote_sum=0.0,
                         score=4.0,
+                        title="",
+                        summary=None,
+                        message_id=None,
                         appearance_count=0,
                         created_at=created_at,
                     )
@@ -85,35 +90,36 @@ async def test_get_top_noms_requires_seconding(monkeypatch):
 
     stmt = session.executed[0]
     clauses = list(stmt._where_criteria)
+
+    def _is_reaction_guard(clause):
+        right = getattr(clause, "right", None)
+        operator = getattr(clause, "operator", None)
+        return (
+            getattr(right, "value", None) == 0
+            and getattr(operator, "__name__", None) == "gt"
+            and "reactions" in str(getattr(clause, "left", ""))
+        )
+
     assert any(
-        getattr(clause.right, "value", None) == 0
-        and clause.operator.__name__ == "gt"
-        and "reactions" in str(clause.left)
-        for clause in clauses
+        _is_reaction_guard(clause) for clause in clauses
     ), "Ballot query should require at least one reaction"
 
 
 @pytest.mark.asyncio
 async def test_get_top_noms_blocks_fourth_appearance(monkeypatch):
-    created_old = datetime(2023, 1, 1, tzinfo=timezone.utc)
     created_new = datetime(2023, 6, 1, tzinfo=timezone.utc)
     session = DummySession(
         execute_results=[
             DummyResult(
                 rows=[
-                    SimpleNamespace(
-                        book_id=1,
-                        reactions=5,
-                        vote_sum=2.0,
-                        score=7.0,
-                        appearance_count=settings.max_election_appearances,
-                        created_at=created_old,
-                    ),
                     SimpleNamespace(
                         book_id=2,
                         reactions=3,
                         vote_sum=1.0,
                         score=4.0,
+                        title="",
+                        summary=None,
+                        message_id=None,
                         appearance_count=1,
                         created_at=created_new,
                     ),
@@ -127,31 +133,41 @@ async def test_get_top_noms_blocks_fourth_appearance(monkeypatch):
     result = await vs.get_top_noms(session, limit=0)
 
     assert result == [BallotNominee(2, 3, 1.0, 4.0, 1, created_at=created_new)]
+    # The appearance cap is enforced inside the statement itself.
+    compiled = str(session.executed[0].compile(compile_kwargs={"literal_binds": True}))
+    assert f"< {settings.max_election_appearances}" in compiled
 
 
 @pytest.mark.asyncio
-async def test_get_top_noms_uses_created_at_for_tiebreak(monkeypatch):
+async def test_get_top_noms_orders_and_limits_in_sql(monkeypatch):
     created_old = datetime(2023, 5, 1, tzinfo=timezone.utc)
     created_new = datetime(2023, 6, 1, tzinfo=timezone.utc)
+    # Rows arrive already ranked by the database; they are returned as-is.
     session = DummySession(
         execute_results=[
             DummyResult(
                 rows=[
                     SimpleNamespace(
-                        book_id=1,
+                        book_id=2,
                         reactions=2,
                         vote_sum=2.0,
                         score=4.0,
+                        title="",
+                        summary=None,
+                        message_id=None,
                         appearance_count=0,
-                        created_at=created_new,
+                        created_at=created_old,
                     ),
                     SimpleNamespace(
-                        book_id=2,
+                        book_id=1,
                         reactions=2,
                         vote_sum=2.0,
                         score=4.0,
+                        title="",
+                        summary=None,
+                        message_id=None,
                         appearance_count=0,
-                        created_at=created_old,
+                        created_at=created_new,
                     ),
                 ]
             )
@@ -160,9 +176,15 @@ async def test_get_top_noms_uses_created_at_for_tiebreak(monkeypatch):
     vs = VotingSession(bot=SimpleNamespace())
     monkeypatch.setattr(vs, "update_all_nominations", AsyncMock())
 
-    result = await vs.get_top_noms(session, limit=1)
+    result = await vs.get_top_noms(session, limit=2)
 
-    assert [nom.book_id for nom in result] == [2]
+    assert [nom.book_id for nom in result] == [2, 1]
+    stmt = session.executed[0]
+    order_by = [str(clause) for clause in stmt._order_by_clauses]
+    assert "OVER ()" in order_by[0], "Top scorer should rank first"
+    assert order_by[-2].endswith("DESC"), "Score should rank before the tiebreak"
+    assert "created_at" in order_by[-1], "created_at should break ties"
+    assert stmt._limit_clause.value == 2
 
 
 @pytest.mark.asyncio
@@ -174,8 +196,8 @@ async def test_open_voting_aborts_if_open(monkeypatch):
         "bot.commands.voting_session.async_session", lambda: session_cm(session)
     )
     monkeypatch.setattr(
-        "bot.commands.voting_session.get_open_election",
-        AsyncMock(return_value=SimpleNamespace()),
+        "bot.commands.voting_session.open_election_exists",
+        AsyncMock(return_value=True),
     )
 
     await vs.open_voting(interaction)
@@ -188,7 +210,7 @@ async def test_open_voting_aborts_if_open(monkeypatch):
 @pytest.mark.asyncio
 async def test_open_voting_creates_election(monkeypatch):
     interaction = DummyInteraction()
-    session = DummySession()
+    session = DummySession(execute_results=[DummyResult(scalar=11), DummyResult()])
     vs = VotingSession(bot=SimpleNamespace())
     created_first = datetime(2023, 1, 1, tzinfo=timezone.utc)
     created_second = datetime(2023, 1, 2, tzinfo=timezone.utc)
@@ -207,7 +229,8 @@ async def test_open_voting_creates_election(monkeypatch):
         "bot.commands.voting_session.async_session", lambda: session_cm(session)
     )
     monkeypatch.setattr(
-        "bot.commands.voting_session.get_open_election", AsyncMock(return_value=None)
+        "bot.commands.voting_session.open_election_exists",
+        AsyncMock(return_value=False),
     )
     monkeypatch.setattr(vs, "get_top_noms", AsyncMock(return_value=ballot_values))
     fake_embed = AsyncMock()
@@ -219,14 +242,18 @@ async def test_open_voting_creates_election(monkeypatch):
 
     assert interaction.response.deferred is True
     vs.get_top_noms.assert_awaited_once_with(session, limit=5)
-    election = next(obj for obj in session.added if isinstance(obj, Election))
-    assert election.ballot == [1, 2]
-    assert election.closes_at == fixed_now + timedelta(hours=4)
+    insert_params = session.executed[0].compile().params
+    assert insert_params["ballot"] == [1, 2]
+    assert insert_params["closes_at"] == fixed_now + timedelta(hours=4)
+    assert session.executed_params[1] == [
+        {"election_id": 11, "position": 0, "book_id": 1},
+        {"election_id": 11, "position": 1, "book_id": 2},
+    ]
     fake_embed.assert_awaited_once()
     args, kwargs = fake_embed.await_args
     assert args[:4] == (
         interaction,
-        election.id,
+        11,
         [1, 2],
         fixed_now + timedelta(hours=4),
     )
@@ -236,7 +263,8 @@ async def test_open_voting_creates_election(monkeypatch):
         if nominee.prior_appearances == settings.max_election_appearances - 1
     }
     assert args[4] == expected_starred
-    assert kwargs == {}
+    assert kwargs["session"] is session
+    assert [entry.book_id for entry in kwargs["entries"]] == [1, 2]
     assert session.commit_calls == 1
 
 
@@ -249,7 +277,8 @@ async def test_open_voting_accepts_custom_ballot_size(monkeypatch):
         "bot.commands.voting_session.async_session", lambda: session_cm(session)
     )
     monkeypatch.setattr(
-        "bot.commands.voting_session.get_open_election", AsyncMock(return_value=None)
+        "bot.commands.voting_session.open_election_exists",
+        AsyncMock(return_value=False),
     )
     ballot_mock = AsyncMock(
         return_value=[
@@ -284,7 +313,8 @@ async def test_open_voting_requires_ballot(monkeypatch):
         "bot.commands.voting_session.async_session", lambda: session_cm(session)
     )
     monkeypatch.setattr(
-        "bot.commands.voting_session.get_open_election", AsyncMock(return_value=None)
+        "bot.commands.voting_session.open_election_exists",
+        AsyncMock(return_value=False),
     )
     monkeypatch.setattr(vs, "get_top_noms", AsyncMock(return_value=[]))
 
@@ -303,12 +333,15 @@ async def test_election_embed_posts_summary(monkeypatch):
     long_summary = "A" * 2000
     session = DummySession(
         execute_results=[
-            DummyResult(scalars=[SimpleNamespace(book_id=1, message_id=99)]),
             DummyResult(
-                scalars=[SimpleNamespace(id=1, title="Book", summary=long_summary)]
+                rows=[
+                    SimpleNamespace(
+                        id=1, title="Book", summary=long_summary, message_id=99
+                    )
+                ]
             ),
+            DummyResult(),
         ],
-        get_results={1: SimpleNamespace(id=1, ballot_message_id=None)},
     )
     monkeypatch.setattr(
         "bot.commands.voting_session.async_session", lambda: session_cm(session)
@@ -341,10 +374,11 @@ async def test_election_embed_posts_summary(monkeypatch):
 async def test_election_embed_marks_third_appearance(monkeypatch):
     session = DummySession(
         execute_results=[
-            DummyResult(scalars=[SimpleNamespace(book_id=1, message_id=77)]),
-            DummyResult(scalars=[SimpleNamespace(id=1, title="Novel", summary=None)]),
+            DummyResult(
+                rows=[SimpleNamespace(id=1, title="Novel", summary=None, message_id=77)]
+            ),
+            DummyResult(),
         ],
-        get_results={1: SimpleNamespace(id=1, ballot_message_id=None)},
     )
     monkeypatch.setattr(
         "bot.commands.voting_session.async_session", lambda: session_cm(session)
@@ -608,7 +642,7 @@ async def test_result_preview_lists_totals(monkeypatch):
                 ]
             ),
             DummyResult(
-                scalars=[
+                rows=[
                     SimpleNamespace(id=1, title="Alpha: Book"),
                     SimpleNamespace(id=2, title="Beta Adventures"),
                 ]
@@ -642,8 +676,8 @@ async def test_ballot_preview_requires_no_open_election(monkeypatch):
         "bot.commands.voting_session.async_session", lambda: session_cm(session)
     )
     monkeypatch.setattr(
-        "bot.commands.voting_session.get_open_election",
-        AsyncMock(return_value=SimpleNamespace()),
+        "bot.commands.voting_session.open_election_exists",
+        AsyncMock(return_value=True),
     )
 
     await vs.ballot_preview(interaction)
@@ -656,27 +690,13 @@ async def test_ballot_preview_requires_no_open_election(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_ballot_preview_sends_embed(monkeypatch):
-    session = DummySession(
-        execute_results=[
-            DummyResult(
-                scalars=[
-                    SimpleNamespace(book_id=1, message_id=101),
-                    SimpleNamespace(book_id=2, message_id=202),
-                ]
-            ),
-            DummyResult(
-                scalars=[
-                    SimpleNamespace(id=1, title="Book One", summary="Summary"),
-                    SimpleNamespace(id=2, title="Book Two", summary="Details"),
-                ]
-            ),
-        ]
-    )
+    session = DummySession(execute_results=[])
     monkeypatch.setattr(
         "bot.commands.voting_session.async_session", lambda: session_cm(session)
     )
     monkeypatch.setattr(
-        "bot.commands.voting_session.get_open_election", AsyncMock(return_value=None)
+        "bot.commands.voting_session.open_election_exists",
+        AsyncMock(return_value=False),
     )
     vs = VotingSession(bot=SimpleNamespace())
     star_threshold = (
@@ -692,6 +712,9 @@ async def test_ballot_preview_sends_embed(monkeypatch):
             3.0,
             star_threshold if star_threshold is not None else 0,
             created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            title="Book One",
+            summary="Summary",
+            message_id=101,
         ),
         BallotNominee(
             2,
@@ -700,6 +723,9 @@ async def test_ballot_preview_sends_embed(monkeypatch):
             1.5,
             0,
             created_at=datetime(2024, 1, 2, tzinfo=timezone.utc),
+            title="Book Two",
+            summary="Details",
+            message_id=202,
         ),
     ]
     monkeypatch.setattr(
@@ -768,19 +794,90 @@ async def test_get_reacts_for_nomination_counts_unique(monkeypatch):
     assert count == 3
 
 
+@pytest.mark.asyncio
+async def test_get_channel_caches_lookups():
+    calls = []
+    channel = SimpleNamespace()
+
+    def get_channel(channel_id):
+        calls.append(channel_id)
+        return channel
+
+    vs = VotingSession(bot=SimpleNamespace(get_channel=get_channel))
+
+    first = await vs._get_channel(42)
+    second = await vs._get_channel(42)
+
+    assert first is channel
+    assert second is channel
+    assert calls == [42]
+
+
+@pytest.mark.asyncio
+async def test_update_all_nominations_uses_history_cache():
+    from discord.ext import commands
+
+    class HistoryChannel(DummyChannel):
+        def __init__(self, channel_id, messages):
+            super().__init__(channel_id)
+            self._history = messages
+
+        def history(self, limit=None):
+            async def generator():
+                for message in self._history:
+                    yield message
+
+            return generator()
+
+        async def fetch_message(self, _message_id):
+            raise AssertionError("history cache should have been used")
+
+    message = SimpleNamespace(id=10, reactions=[])
+    bot = commands.Bot()
+    channel = HistoryChannel(settings.nom_channel_id, [message])
+    bot.add_channel(settings.nom_channel_id, channel)
+    nomination = SimpleNamespace(
+        id=1, message_id=10, nominator_discord_id=1, reactions=3
+    )
+    session = DummySession(
+        execute_results=[DummyResult(scalars=[nomination]), DummyResult()]
+    )
+    vs = VotingSession(bot=bot)
+
+    await vs.update_all_nominations(session)
+
+    assert session.executed_params[1] == [{"b_id": 1, "b_reactions": 0}]
+    assert session.commit_calls == 1
+
+
 @pytest.mark.asyncio
 async def test_update_all_nominations_refreshes_data(monkeypatch):
-    nomination = SimpleNamespace(reactions=0)
-    session = DummySession(execute_results=[DummyResult(scalars=[nomination])])
+    nomination = SimpleNamespace(id=7, message_id=10, reactions=0)
+    session = DummySession(
+        execute_results=[DummyResult(scalars=[nomination]), DummyResult()]
+    )
     vs = VotingSession(bot=SimpleNamespace())
     monkeypatch.setattr(vs, "get_reacts_for_nomination", AsyncMock(return_value=5))
 
     await vs.update_all_nominations(session)
 
-    assert nomination.reactions == 5
+    assert session.executed_params[1] == [{"b_id": 7, "b_reactions": 5}]
     assert session.commit_calls == 1
 
 
+@pytest.mark.asyncio
+async def test_update_all_nominations_skips_unchanged_rows(monkeypatch):
+    nomination = SimpleNamespace(id=7, message_id=10, reactions=5)
+    session = DummySession(execute_results=[DummyResult(scalars=[nomination])])
+    vs = VotingSession(bot=SimpleNamespace())
+    monkeypatch.setattr(vs, "get_reacts_for_nomination", AsyncMock(return_value=5))
+
+    await vs.update_all_nominations(session)
+
+    assert len(session.executed) == 1
+    assert session.commit_calls == 0
+
+
 @pytest.mark.asyncio
 async def test_ballot_preview_handles_empty_ballot(monkeypatch):
     session = DummySession(execute_results=[DummyResult()])
@@ -788,7 +885,8 @@ async def test_ballot_preview_handles_empty_ballot(monkeypatch):
         "bot.commands.voting_session.async_session", lambda: session_cm(session)
     )
     monkeypatch.setattr(
-        "bot.commands.voting_session.get_open_election", AsyncMock(return_value=None)
+        "bot.commands.voting_session.open_election_exists",
+        AsyncMock(return_value=False),
     )
     vs = VotingSession(bot=SimpleNamespace())
     monkeypatch.setattr(vs, "get_top_noms", AsyncMock(return_value=[]))
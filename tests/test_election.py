@@ -36,7 +36,7 @@ def test_close_and_tally_announces_winner(monkeypatch):
         assert winner is book
         assert election.winner == book.id
         assert session.execute.await_count == 1
-        assert session.commit.await_count == 2
+        assert session.commit.await_count == 1
 
         embed = channel.send.await_args.kwargs["embed"]
         assert embed.title == "Election Results"
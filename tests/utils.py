@@ -15,6 +15,9 @@ class DummyScalarResult:
     def all(self) -> list[Any]:
         return list(self._items)
 
+    def first(self):
+        return self._items[0] if self._items else None
+
     def __iter__(self):
         return iter(self._items)
 
@@ -34,6 +37,9 @@ class DummyResult:
     def scalar_one_or_none(self):
         return self._scalar
 
+    def scalar_one(self):
+        return self._scalar
+
     def scalars(self):
         return DummyScalarResult(self._scalars)
 
@@ -56,21 +62,32 @@ class DummySession:
         self.get_results = get_results or {}
         self.added = []
         self.executed = []
+        self.executed_params = []
         self.commit_calls = 0
         self.flush_calls = 0
         self.rollback_calls = 0
         self._commit_hook = commit_hook
         self.deleted = []
 
-    async def execute(self, stmt):
+    async def execute(self, stmt, params=None):
         if not self.execute_results:
             raise AssertionError("Unexpected execute call")
         result = self.execute_results.pop(0)
         self.executed.append(stmt)
+        self.executed_params.append(params)
         if callable(result):
             result = result()
         return result
 
+    async def stream_scalars(self, stmt, params=None):
+        result = await self.execute(stmt, params)
+
+        async def _iterate():
+            for item in result.scalars():
+                yield item
+
+        return _iterate()
+
     async def get(self, _model, key):
         value = self.get_results.get(key)
         return value() if callable(value) else value